@@ -6,22 +6,31 @@ Created on 6 Aug 2021.
 
 import logging
 
-from math import cos, radians, sin, sqrt
-from functools import wraps
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from math import cos, floor, radians, sin
 
 try:
     from PyQt6.QtCore import pyqtSlot
 except ImportError:
     from PyQt5.QtCore import pyqtSlot
 
-from qtpy.QtCore import QLine, QPoint, QPointF, QRectF, Qt
+from qtpy.QtCore import QEvent, QLine, QLineF, QPoint, QPointF, QRect, QRectF, Qt
 from qtpy.QtGui import (
     QBrush,
+    QFont,
     QPainter,
+    QPainterPath,
+    QPen,
+    QImage,
     QPolygonF,
     QColor,
     QLinearGradient,
     QRadialGradient,
+    QRegion,
+    QStaticText,
+    QTransform,
 )
 from qtpy.QtWidgets import (
     QWidget,
@@ -34,12 +43,270 @@ G5_HEIGHT = 360
 G5_CENTER_Y = G5_HEIGHT / 2
 HSI_CENTER = 190
 
-g5Diag = sqrt(G5_WIDTH ** 2 + G5_HEIGHT ** 2)
+# sqrt(G5_WIDTH ** 2 + G5_HEIGHT ** 2)
+g5Diag = 600.0
 
 mstokt = 1.94384
 
+# smallest DREF variation triggering a repaint
+DREF_EPSILON = 1e-3
+
+# laid out texts kept per widget, the least recently drawn ones are dropped
+STATIC_TEXT_CACHE_SIZE = 512
+
 GREY_COLOR = QColor(128, 128, 128, 255)
 
+# widget properties, stored as underscore prefixed attributes: name, default
+PROPERTY_DEFAULTS = (
+    ("gpsdmedist", 0),
+    ("gpshsisens", 0),
+    ("nav1type", 0),
+    ("nav2type", 0),
+    ("gpstype", 0),
+    ("avionicson", 0),
+    ("hsiSource", 0),
+    ("nav1fromto", 0),
+    ("nav2fromto", 0),
+    ("gpsfromto", 0),
+    ("nav1crs", 0),
+    ("nav1gsavailable", 0),
+    ("nav1gs", 0),
+    ("nav2crs", 0),
+    ("gpscrs", 0),
+    ("nav2gsavailable", 0),
+    ("nav2gs", 0),
+    ("nav1dft", 0),
+    ("nav2dft", 0),
+    ("gpsdft", 0),
+    ("gpsgsavailable", 0),
+    ("gpsvnavavailable", 0),
+    ("gpsgs", 0),
+    ("groundTrack", 0),
+    ("magHeading", 0),
+    ("windDirection", 0),
+    ("windSpeed", 0),
+    ("rollAngle", 0),
+    ("pitchAngle", 0),
+    ("gs", 0),
+    ("kias", 0),
+    ("kiasDelta", 0),
+    ("ktas", 0),
+    ("altitude", 0),
+    ("alt_setting", 29.92),
+    ("vh_ind_fpm", 0),
+    ("turnRate", 0),
+    ("slip", 0),
+    ("headingBug", 0),
+    ("vs", 30),
+    ("vs0", 23),
+    ("vfe", 88),
+    ("vno", 118),
+    ("vne", 127),
+)
+PROPERTY_ATTRIBUTES = frozenset(f"_{name}" for name, default in PROPERTY_DEFAULTS)
+
+# properties the glideslope indicator depends on, it is drawn by both widgets
+GLIDESLOPE_PROPERTIES = frozenset(
+    [
+        "_hsiSource",
+        "_nav1gsavailable",
+        "_nav1gs",
+        "_nav2gsavailable",
+        "_nav2gs",
+        "_gpsgsavailable",
+        "_gpsvnavavailable",
+        "_gpsgs",
+    ]
+)
+
+# properties of the selected navigation source, see derive_settings
+NAVIGATION_PROPERTIES = GLIDESLOPE_PROPERTIES | frozenset(
+    [
+        "_gpshsisens",
+        "_nav1type",
+        "_nav2type",
+        "_nav1fromto",
+        "_nav2fromto",
+        "_gpsfromto",
+        "_nav1crs",
+        "_nav2crs",
+        "_gpscrs",
+        "_nav1dft",
+        "_nav2dft",
+        "_gpsdft",
+    ]
+)
+
+
+# GPS CDI annunciators by HSI sensitivity rounded to 2 decimals, at or below
+# 0.1 the GPS is in LNAV
+GPS_CDI_ANNUNCIATORS = {0.12: "DEPT", 0.4: "TERM", 0.8: "ENR"}
+
+# preformatted heading, wind speed and airspeed readouts
+DEGREE_STRINGS = tuple("{:03d}˚".format(i) for i in range(360))
+KNOT_STRINGS = tuple("{:02d}kt".format(i) for i in range(200))
+SPEED_STRINGS = tuple("{:03d}".format(i) for i in range(400))
+
+# (cos, sin) of the 5 degrees multiples used by the compass rose and roll scale
+TRIG_5DEG = {i: (cos(radians(i)), sin(radians(i))) for i in range(0, 360, 5)}
+
+
+def formatDegrees(value):
+    """Format an angle readout.
+
+    Args:
+        value: angle in degrees
+
+    Returns:
+        string
+    """
+    value = int(value)
+    if 0 <= value < len(DEGREE_STRINGS):
+        return DEGREE_STRINGS[value]
+    return f"{value:03d}˚"
+
+
+def formatKnots(value):
+    """Format a wind speed readout.
+
+    Args:
+        value: speed in knots
+
+    Returns:
+        string
+    """
+    value = int(value)
+    if 0 <= value < len(KNOT_STRINGS):
+        return KNOT_STRINGS[value]
+    return f"{value:02d}kt"
+
+
+def formatSpeed(value):
+    """Format an airspeed readout.
+
+    Args:
+        value: speed in knots
+
+    Returns:
+        string
+    """
+    value = int(value)
+    if 0 <= value < len(SPEED_STRINGS):
+        return SPEED_STRINGS[value]
+    return f"{value:03d}"
+
+
+@lru_cache(maxsize=1024)
+def _formatAltitude(value):
+    return f"{value:05d}"
+
+
+def formatAltitude(value):
+    """Format an altitude readout.
+
+    The altitude moves slowly compared to the repaint rate, the recently
+    formatted values are cached.
+
+    Args:
+        value: altitude in feet
+
+    Returns:
+        string
+    """
+    return _formatAltitude(int(value))
+
+
+# properties only shown as text readouts: a change is not repainted
+# unless the displayed text changes
+PROPERTY_READOUTS = {
+    "_ktas": int,
+    "_gs": lambda value: int(value * mstokt),
+    "_windSpeed": lambda value: formatKnots(value * mstokt),
+    "_alt_setting": lambda value: f"{value:02.02f}",
+}
+
+
+def tapeTicks(value, tapeScale, step, minimum=None):
+    """Compute the ticks of a vertical tape centered on a value.
+
+    Args:
+        value: value at the center of the tape
+        tapeScale: value range covered by the tape height
+        step: tick spacing
+        minimum: values at or below it are not shown
+
+    Returns:
+        list of (tick value, height) from the top of the tape
+    """
+    lowest = value - tapeScale / 2
+    if minimum is not None:
+        lowest = max(minimum, lowest)
+
+    top = int(value + tapeScale / 2)
+    top -= top % step
+
+    pixelPerUnit = 2 * G5_CENTER_Y / tapeScale
+
+    return [
+        (tick, G5_CENTER_Y - (tick - value) * pixelPerUnit)
+        for tick in range(top, floor(lowest), -step)
+    ]
+
+
+def speedBands(kias, vs0, vs, vfe, vno, vne, tapeScale):
+    """Compute the vertical extent of the speed tape color bands.
+
+    Args:
+        kias: indicated airspeed at the center of the tape
+        vs0: stall speed in landing configuration
+        vs: stall speed
+        vfe: maximum flaps extended speed
+        vno: maximum structural cruising speed
+        vne: never exceed speed
+        tapeScale: speed range covered by the tape height
+
+    Returns:
+        (top, height) of the red, yellow, green and white bands, None for the
+        bands above the top of the tape
+    """
+    tapeTop = kias + tapeScale / 2
+    pixelPerKnot = 2 * G5_CENTER_Y / tapeScale
+    vneHeight = G5_CENTER_Y - (vne - kias) * pixelPerKnot
+
+    red = (0, vneHeight) if tapeTop > vne else None
+    yellow = (vneHeight, (vne - vno) * pixelPerKnot) if tapeTop > vno else None
+    if tapeTop > vs:
+        green = (
+            max(0, G5_CENTER_Y - (vno - kias) * pixelPerKnot),
+            G5_CENTER_Y - (vs - kias) * pixelPerKnot,
+        )
+        white = (
+            max(0, G5_CENTER_Y - (vfe - kias) * pixelPerKnot),
+            G5_CENTER_Y - (vs0 - kias) * pixelPerKnot,
+        )
+    else:
+        green = white = None
+
+    return red, yellow, green, white
+
+
+def makePen(width, color, style=Qt.PenStyle.SolidLine):
+    """Create a pen.
+
+    Args:
+        width: pen width
+        color: pen color
+        style: pen style
+
+    Returns:
+        QPen
+    """
+    pen = QPen()
+    pen.setColor(color)
+    pen.setWidthF(width)
+    pen.setStyle(style)
+    return pen
+
 
 class pyG5DualStack(QWidget):
     """Base class for the G5 wdiget view."""
@@ -76,6 +343,7 @@ class pyG5Widget(QWidget):
     nav_color: Qt.GlobalColor
     nav_dft: int
     nav_from_to: int
+    hsi_source: int
     nav_crs: int
     gs_available: bool
     gs_dev: float
@@ -94,123 +362,307 @@ class pyG5Widget(QWidget):
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        """property name, default value"""
-        propertyList = [
-            ("gpsdmedist", 0),
-            ("gpshsisens", 0),
-            ("nav1type", 0),
-            ("nav2type", 0),
-            ("gpstype", 0),
-            ("avionicson", 0),
-            ("hsiSource", 0),
-            ("nav1fromto", 0),
-            ("nav2fromto", 0),
-            ("gpsfromto", 0),
-            ("nav1crs", 0),
-            ("nav1gsavailable", 0),
-            ("nav1gs", 0),
-            ("nav2crs", 0),
-            ("gpscrs", 0),
-            ("nav2gsavailable", 0),
-            ("nav2gs", 0),
-            ("nav1dft", 0),
-            ("nav2dft", 0),
-            ("gpsdft", 0),
-            ("gpsgsavailable", 0),
-            ("gpsvnavavailable", 0),
-            ("gpsgs", 0),
-            ("groundTrack", 0),
-            ("magHeading", 0),
-            ("windDirection", 0),
-            ("windSpeed", 0),
-            ("rollAngle", 0),
-            ("pitchAngle", 0),
-            ("gs", 0),
-            ("kias", 0),
-            ("kiasDelta", 0),
-            ("ktas", 0),
-            ("altitude", 0),
-            ("alt_setting", 29.92),
-            ("vh_ind_fpm", 0),
-            ("turnRate", 0),
-            ("slip", 0),
-            ("headingBug", 0),
-            ("vs", 30),
-            ("vs0", 23),
-            ("vfe", 88),
-            ("vno", 118),
-            ("vne", 127),
-        ]
+        for name, default in PROPERTY_DEFAULTS:
+            setattr(self, f"_{name}", default)
+
+        # avionics off screen, rendered on first use
+        self._offLayer = None
+
+        # glideslope shapes, keyed by the draw_glideslope geometry arguments
+        self._gsGeometry = {}
+
+        # fonts derived from the widget font, keyed by (pixel size, bold)
+        self._fonts = {}
+
+        # laid out texts, keyed by (font key, text), least recently drawn first
+        self._staticTexts = OrderedDict()
+
+        # pens and brushes of the navigation source dependent colors, keyed
+        # by their attributes, see pen() and brush()
+        self._pens = {}
+        self._brushes = {}
+
+        # properties drawn by the widget, changes to the other ones are
+        # stored but not repainted
+        self._displayedProperties = PROPERTY_ATTRIBUTES
+
+        # area repainted when only this property changed, keyed by attribute
+        # name. Displayed properties not listed here repaint the whole widget.
+        self._dirtyRects = {}
+
+        # pens with a fixed color, the navigation colored ones use setPen
+        self._penBlack1 = makePen(1, Qt.GlobalColor.black)
+        self._penWhite1 = makePen(1, Qt.GlobalColor.white)
+        self._penWhite2 = makePen(2, Qt.GlobalColor.white)
+        self._penGrey2 = makePen(2, GREY_COLOR)
+        self._penGrey3Dash = makePen(3, GREY_COLOR, Qt.PenStyle.DashLine)
+        self._penCyan1 = makePen(1, Qt.GlobalColor.cyan)
+        self._penCyan2 = makePen(2, Qt.GlobalColor.cyan)
+        self._penTransparent = makePen(0, Qt.GlobalColor.transparent)
+
+        # brushes with a fixed color
+        self._brushBlack = QBrush(Qt.GlobalColor.black)
+        self._brushWhite = QBrush(Qt.GlobalColor.white)
+        self._brushCyan = QBrush(Qt.GlobalColor.cyan)
+        self._brushMagenta = QBrush(Qt.GlobalColor.magenta)
+        self._brushTransparent = QBrush(Qt.GlobalColor.transparent)
+        self._brushNone = QBrush(Qt.BrushStyle.NoBrush)
+
+    def resizeEvent(self, event):
+        """Invalidate the avionics off screen on resize."""
+        self._offLayer = None
+        QWidget.resizeEvent(self, event)
+
+    def paintAvionicsOff(self):
+        """Paint the avionics off screen, a crossed black screen."""
+        if self._offLayer is None:
+            self._offLayer = self.newLayer()
+
+            self.qp = QPainter(self._offLayer)
+            self.qp.setPen(self._penBlack1)
+            self.qp.setBrush(self._brushBlack)
+            self.qp.drawRect(0, 0, G5_WIDTH, G5_HEIGHT)
+            self.qp.setPen(self._penWhite1)
+            self.qp.drawLine(0, 0, G5_WIDTH, G5_HEIGHT)
+            self.qp.drawLine(0, G5_HEIGHT, G5_WIDTH, 0)
+            self.qp.end()
+
+        self.qp = QPainter(self)
+        self.qp.drawImage(0, 0, self._offLayer)
+        self.qp.end()
+
+    def newLayer(self):
+        """Create an image to cache a layer of the widget.
+
+        QImage is used rather than QPixmap so the layers are always rendered
+        by the raster engine, whatever the platform pixmap backend is.
+
+        Returns:
+            QImage sized for the widget and its device pixel ratio
+        """
+        ratio = self.devicePixelRatioF()
+        layer = QImage(self.size() * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+        layer.setDevicePixelRatio(ratio)
+        return layer
+
+    def changeEvent(self, event):
+        """Drop the cached fonts and texts when the widget font changes."""
+        if event.type() == QEvent.Type.FontChange:
+            self._fonts = {}
+            self._staticTexts.clear()
+        QWidget.changeEvent(self, event)
+
+    def pixelFont(self, pixelSize, bold):
+        """Return the widget font with the given pixel size and weight.
+
+        Args:
+            pixelSize: font size in pixel
+            bold: True for a bold font
+
+        Returns:
+            QFont
+        """
+        key = (pixelSize, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont(self.font())
+            font.setPixelSize(pixelSize)
+            font.setBold(bold)
+            self._fonts[key] = font
+        return font
+
+    def pen(self, width: float, color, style=Qt.PenStyle.SolidLine):
+        """Return a cached pen.
 
-        def _make_setter(val):
-            """Generate a setter function."""
+        Args:
+            width: pen width
+            color: pen color
+            style: pen style
+
+        Returns:
+            QPen
+        """
+        # QColor is not hashable, key it by its rgba value
+        key = (width, color.rgba() if isinstance(color, QColor) else color, style)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = makePen(width, color, style)
+            self._pens[key] = pen
+        return pen
 
-            @wraps(val)
-            def setter(inputVal):
-                setattr(self, "_{}".format(val), inputVal)
-                self.repaint()
+    def brush(self, color):
+        """Return a cached brush.
 
-            return setter
+        Args:
+            color: brush color
 
-        for prop in propertyList:
-            setattr(self, "_{}".format(prop[0]), prop[1])
-            setattr(self, "{}".format(prop[0]), _make_setter(prop[0]))
+        Returns:
+            QBrush
+        """
+        key = color.rgba() if isinstance(color, QColor) else color
+        brush = self._brushes.get(key)
+        if brush is None:
+            brush = QBrush(color)
+            self._brushes[key] = brush
+        return brush
 
     def setPen(self, width: float, color, style=Qt.PenStyle.SolidLine):
         """Set the pen color and width."""
-        pen = self.qp.pen()
-        pen.setColor(color)
-        pen.setWidthF(width)
-        pen.setStyle(style)
-        self.qp.setPen(pen)
+        self.qp.setPen(self.pen(width, color, style))
+
+    def drawStaticText(self, rect, alignment, text):
+        """Draw a text which layout is kept between paints.
+
+        Layouts are cached per text and painter font, up to
+        STATIC_TEXT_CACHE_SIZE of them, the least recently drawn one is
+        dropped first.
+
+        Args:
+            rect: rectangle the text is aligned in
+            alignment: Qt.AlignmentFlag combination
+            text: text to draw
+        """
+        font = self.qp.font()
+        key = (font.key(), text)
+        staticText = self._staticTexts.get(key)
+        if staticText is None:
+            staticText = QStaticText(text)
+            staticText.setTextFormat(Qt.TextFormat.PlainText)
+            staticText.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            staticText.prepare(QTransform(), font)
+            self._staticTexts[key] = staticText
+            if len(self._staticTexts) > STATIC_TEXT_CACHE_SIZE:
+                self._staticTexts.popitem(last=False)
+        else:
+            self._staticTexts.move_to_end(key)
+
+        size = staticText.size()
+        if alignment & Qt.AlignmentFlag.AlignRight:
+            x = rect.right() - size.width()
+        elif alignment & Qt.AlignmentFlag.AlignHCenter:
+            x = rect.center().x() - size.width() / 2
+        else:
+            x = rect.left()
+        if alignment & Qt.AlignmentFlag.AlignBottom:
+            y = rect.bottom() - size.height()
+        elif alignment & Qt.AlignmentFlag.AlignVCenter:
+            y = rect.center().y() - size.height() / 2
+        else:
+            y = rect.top()
+
+        self.qp.drawStaticText(QPointF(x, y), staticText)
+
+    def setValue(self, name, value):
+        """Set a single property and schedule a repaint if it changed.
+
+        Args:
+            name: property name, without the leading underscore
+            value: new value
+        """
+        attribute = f"_{name}"
+        if attribute not in PROPERTY_ATTRIBUTES:
+            self.logger.error(f"unknown property {name}")
+            return
+
+        previous = getattr(self, attribute)
+        if previous == value:
+            return
+        setattr(self, attribute, value)
+
+        if attribute not in self._displayedProperties:
+            return
+
+        readout = PROPERTY_READOUTS.get(attribute)
+        if readout is not None and readout(previous) == readout(value):
+            return
+
+        dirtyRect = self._dirtyRects.get(attribute)
+        if dirtyRect is None:
+            self.update()
+        else:
+            self.update(dirtyRect)
 
     @pyqtSlot(dict)
     def drefHandler(self, retValues):
-        """Handle the DREF update."""
+        """Handle the DREF update.
+
+        Values are only stored when they moved by more than DREF_EPSILON and
+        a single repaint is scheduled if any of them did. Properties the
+        widget does not display are stored but not repainted, readout only
+        properties are not repainted until their text changes. The repaint
+        is limited to the dirty rects when all the changed properties have
+        one. DREFs which are not widget properties are ignored.
+        """
+        changed = False
+        fullUpdate = False
+        dirtyRegion = QRegion()
         for idx, value in retValues.items():
+            if value[3] not in PROPERTY_ATTRIBUTES:
+                continue
             try:
-                setattr(self, value[3], value[0])
+                previous = getattr(self, value[3])
+                if abs(previous - value[0]) > DREF_EPSILON:
+                    setattr(self, value[3], value[0])
+
+                    if value[3] not in self._displayedProperties:
+                        continue
+
+                    readout = PROPERTY_READOUTS.get(value[3])
+                    if readout is not None and readout(previous) == readout(value[0]):
+                        continue
+                    changed = True
+
+                    dirtyRect = self._dirtyRects.get(value[3])
+                    if dirtyRect is None:
+                        fullUpdate = True
+                    else:
+                        dirtyRegion = dirtyRegion.united(dirtyRect)
             except Exception as e:
-                self.logger.error("failed to set value {}: {}".format(value[5], e))
-        self.repaint()
+                self.logger.error("failed to set value {}: {}".format(value[3], e))
+
+        if fullUpdate:
+            self.update()
+        elif changed:
+            self.update(dirtyRegion)
 
     def derive_settings(self):
         self.nav_color = Qt.GlobalColor.green
         self.gps_cdi_annunciator = ""
-        if int(self._hsiSource) == 2:
+        self.hsi_source = int(self._hsiSource)
+        if self.hsi_source == 2:
             self.cdi_source = "GPS"
 
-            sensi = round(self._gpshsisens, 1)
+            sensi = round(self._gpshsisens, 2)
             if sensi <= 0.1:
                 self.gps_cdi_annunciator = "LNAV"
-            elif sensi == 0.12:
-                self.gps_cdi_annunciator = "DEPT"
-            elif sensi == 0.4:
-                self.gps_cdi_annunciator = "TERM"
-            elif sensi == 0.8:
-                self.gps_cdi_annunciator = "ENR"
+            else:
+                self.gps_cdi_annunciator = GPS_CDI_ANNUNCIATORS.get(sensi, "")
 
             self.nav_color = Qt.GlobalColor.magenta
             self.nav_dft = self._gpsdft
-            self.nav_from_to = self._gpsfromto
+            self.nav_from_to = int(self._gpsfromto)
             self.nav_crs = self._gpscrs
             self.gs_available = (self._gpsvnavavailable != -1000) or self._gpsgsavailable
             self.gs_dev = self._gpsgs
-        elif int(self._hsiSource) == 1:
-            self.cdi_source = "{}".format(self.getNavTypeString(self._nav2type, "2"))
+        elif self.hsi_source == 1:
+            self.cdi_source = f"{self.getNavTypeString(self._nav2type, '2')}"
             self.nav_dft = self._nav2dft
-            self.nav_from_to = self._nav2fromto
+            self.nav_from_to = int(self._nav2fromto)
             self.nav_crs = self._nav2crs
             self.gs_available = self._nav2gsavailable
             self.gs_dev = self._nav2gs
         else:
-            self.cdi_source = "{}".format(self.getNavTypeString(self._nav1type, "1"))
+            self.cdi_source = f"{self.getNavTypeString(self._nav1type, '1')}"
             self.nav_dft = self._nav1dft
-            self.nav_from_to = self._nav1fromto
+            self.nav_from_to = int(self._nav1fromto)
             self.nav_crs = self._nav1crs
             self.gs_available = self._nav1gsavailable
             self.gs_dev = self._nav1gs
 
+        self._penNav1 = self.pen(1, self.nav_color)
+        self._penNav2 = self.pen(2, self.nav_color)
+        self._brushNav = self.brush(self.nav_color)
+
     def getNavTypeString(self, navType, navIndex):
         """getNavTypeString.
 
@@ -231,53 +683,29 @@ class pyG5Widget(QWidget):
 
         logging.error("Failed to decode navtype")
 
-    def draw_glideslope(self, gsWidth=16, gsHeigth=192, gsFromLeft=20, frame_color=GREY_COLOR, center=HSI_CENTER):
-        # draw the GlideScope
-        if self.gs_available:
-            gsCircleRad = gsWidth - 6
-            gsDiamond = gsWidth
-
-            # Vertical guidance source
-            rect = QRectF(
-                G5_WIDTH - gsFromLeft - gsWidth,
-                center - gsHeigth / 2 - 15,
-                gsWidth,
-                15,
-            )
-
-            font = self.qp.font()
-            font.setPixelSize(12)
-            self.qp.setFont(font)
-            self.setPen(1, self.nav_color)
-
-            vert_source_txt = "G"
-            if int(self._hsiSource) == 2 and self._gpsgsavailable == 0:
-                vert_source_txt = "V"
-
-            self.qp.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter, vert_source_txt, )
-
-            self.setPen(2 * gsWidth / 16, frame_color)
-            self.qp.setBrush(QBrush(Qt.GlobalColor.transparent))
-
-            self.qp.drawRect(rect)
+    def glideslopeGeometry(self, gsWidth, gsHeigth, gsFromLeft, center):
+        """Return the glideslope shapes for a draw_glideslope geometry.
 
-            # main rectangle
-            self.qp.drawRect(
-                QRectF(
-                    G5_WIDTH - gsFromLeft - gsWidth,
-                    center - gsHeigth / 2,
-                    gsWidth,
-                    gsHeigth,
-                )
-            )
+        Args:
+            gsWidth: scale width
+            gsHeigth: scale height
+            gsFromLeft: distance from the scale to the right side
+            center: vertical center of the scale
 
-            self.qp.drawLine(
-                QPointF(G5_WIDTH - gsFromLeft - gsWidth, center),
-                QPointF(G5_WIDTH - gsFromLeft, center)
-            )
+        Returns:
+            (source rect, scale rect, center line, dots path, diamond,
+            diamond x position, pixels per dot of deviation)
+        """
+        key = (gsWidth, gsHeigth, gsFromLeft, center)
+        geometry = self._gsGeometry.get(key)
+        if geometry is None:
+            gsCircleRad = gsWidth - 6
+            gsDiamond = gsWidth
+            left = G5_WIDTH - gsFromLeft - gsWidth
 
+            dots = QPainterPath()
             for offset in [-70, -35, 35, 70]:
-                self.qp.drawEllipse(
+                dots.addEllipse(
                     QPointF(
                         int(G5_WIDTH - gsFromLeft - gsWidth / 2),
                         int(center + offset),
@@ -286,13 +714,11 @@ class pyG5Widget(QWidget):
                     gsCircleRad / 2,
                 )
 
-            self.setPen(1, Qt.GlobalColor.black)
-            self.qp.setBrush(QBrush(self.nav_color))
-
-            self.qp.translate(
-                G5_WIDTH - gsFromLeft - gsWidth, center + self.gs_dev / 2.5 * gsHeigth / 2
-            )
-            self.qp.drawPolygon(
+            geometry = (
+                QRectF(left, center - gsHeigth / 2 - 15, gsWidth, 15),
+                QRectF(left, center - gsHeigth / 2, gsWidth, gsHeigth),
+                QLineF(left, center, G5_WIDTH - gsFromLeft, center),
+                dots,
                 QPolygonF(
                     [
                         QPointF(0, 0),
@@ -300,10 +726,56 @@ class pyG5Widget(QWidget):
                         QPointF(gsDiamond, 0),
                         QPointF(gsDiamond / 2, -gsDiamond / 2),
                     ]
-                )
+                ),
+                left,
+                gsHeigth / 2 / 2.5,
             )
+            self._gsGeometry[key] = geometry
+        return geometry
+
+    def draw_glideslope(self, gsWidth=16, gsHeigth=192, gsFromLeft=20, frame_color=GREY_COLOR, center=HSI_CENTER):
+        # draw the GlideScope
+        if self.gs_available:
+            (
+                rect,
+                scaleRect,
+                centerLine,
+                dots,
+                diamond,
+                diamondX,
+                pixelPerDot,
+            ) = self.glideslopeGeometry(gsWidth, gsHeigth, gsFromLeft, center)
+
+            # Vertical guidance source
+            self.qp.setFont(self.pixelFont(12, True))
+            self.qp.setPen(self._penNav1)
 
-            self.qp.resetTransform()
+            vert_source_txt = "G"
+            if self.hsi_source == 2 and self._gpsgsavailable == 0:
+                vert_source_txt = "V"
+
+            self.qp.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter, vert_source_txt, )
+
+            self.setPen(2 * gsWidth / 16, frame_color)
+            self.qp.setBrush(self._brushTransparent)
+
+            self.qp.drawRect(rect)
+
+            # main rectangle
+            self.qp.drawRect(scaleRect)
+
+            self.qp.drawLine(centerLine)
+
+            self.qp.drawPath(dots)
+
+            self.qp.setPen(self._penBlack1)
+            self.qp.setBrush(self._brushNav)
+
+            self.qp.save()
+            self.qp.translate(diamondX, center + self.gs_dev * pixelPerDot)
+            self.qp.drawPolygon(diamond)
+
+            self.qp.restore()
 
 
 class pyG5HSIWidget(pyG5Widget):
@@ -320,52 +792,198 @@ class pyG5HSIWidget(pyG5Widget):
         """
         pyG5Widget.__init__(self, parent)
 
-    def paintEvent(self, event):
-        """Paint the widget."""
-        self.derive_settings()
-        self.qp = QPainter(self)
+        self._staticLayer = None
 
         rotatinghsiCircleRadius = 160
         hsiCircleRadius = 90
-        hsiTextRadius = 120
         groundTrackDiamondSize = 7
 
         headingBoxWidth = 50
         headingBoxHeight = 22
 
-        font = self.qp.font()
-        font.setPixelSize(headingBoxHeight - 2)
-        font.setBold(True)
-        self.qp.setFont(font)
+        # CDI deflection scale and limit in dots, the bar stays inside the
+        # HSI circle
+        self._cdiPixelPerDot = 75 / 2
+        self._hsiDeflectionBound = hsiCircleRadius / self._cdiPixelPerDot
 
-        # Draw the background
-        self.setPen(1, Qt.GlobalColor.black)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.black))
-        self.qp.drawRect(0, 0, G5_WIDTH, G5_HEIGHT)
+        self._displayedProperties = NAVIGATION_PROPERTIES | frozenset(
+            [
+                "_avionicson",
+                "_gpsdmedist",
+                "_groundTrack",
+                "_headingBug",
+                "_magHeading",
+                "_windDirection",
+                "_windSpeed",
+            ]
+        )
 
-        if self._avionicson == 0:
-            self.setPen(1, Qt.GlobalColor.white)
-            self.qp.drawLine(0, 0, G5_WIDTH, G5_HEIGHT)
-            self.qp.drawLine(0, G5_HEIGHT, G5_WIDTH, 0)
-            self.qp.end()
-            return
+        # readouts drawn in their own box, the wind speed text can overflow
+        # the wind box on the right
+        self._dirtyRects = {
+            "_windDirection": QRect(0, 0, 112, 47),
+            "_windSpeed": QRect(0, 0, 112, 47),
+            "_gpsdmedist": QRect(G5_WIDTH - 106, 0, 106, 47),
+        }
+
+        # area covered by the compass rose, the heading bug and the ground
+        # track diamond, it does not reach the readout boxes above
+        roseRadius = rotatinghsiCircleRadius + 12
+        self._roseRegion = QRegion(
+            int(G5_CENTER_X) - roseRadius,
+            HSI_CENTER - roseRadius,
+            2 * roseRadius,
+            2 * roseRadius,
+            QRegion.RegionType.Ellipse,
+        )
 
-        # Draw the Horizontal Situation Indicator circle
-        self.setPen(2, GREY_COLOR)
+        # the polygons below do not depend on the state, build them once.
+        # Polygons drawn in a rotated frame are stored in their local
+        # coordinates, the others in widget coordinates.
+        self._headingBugPoly = QPolygonF(
+            [
+                QPointF(-9, rotatinghsiCircleRadius - 1),
+                QPointF(+9, rotatinghsiCircleRadius - 1),
+                QPointF(+9, rotatinghsiCircleRadius + 6),
+                QPointF(+6, rotatinghsiCircleRadius + 6),
+                QPointF(0, rotatinghsiCircleRadius + 1),
+                QPointF(-6, rotatinghsiCircleRadius + 6),
+                QPointF(-9, rotatinghsiCircleRadius + 6),
+            ]
+        )
 
-        # offset the center to the Horizontal Situation Indicator center
-        self.qp.translate(G5_CENTER_X, HSI_CENTER)
+        self._cdiArrowPoly = QPolygonF(
+            [
+                QPointF(rotatinghsiCircleRadius - 10, 0),
+                QPointF(rotatinghsiCircleRadius - 40, -20),
+                QPointF(rotatinghsiCircleRadius - 33, -3),
+                QPointF(hsiCircleRadius - 10, -3),
+                QPointF(hsiCircleRadius - 10, 3),
+                QPointF(rotatinghsiCircleRadius - 33, 3),
+                QPointF(rotatinghsiCircleRadius - 40, 20),
+            ]
+        )
 
-        self.qp.drawArc(
-            -hsiCircleRadius,
-            -hsiCircleRadius,
-            2 * hsiCircleRadius,
-            2 * hsiCircleRadius,
-            0,
-            360 * 16,
+        self._cdiBarPoly = QPolygonF(
+            [
+                QPointF(-rotatinghsiCircleRadius + 10, -3),
+                QPointF(-hsiCircleRadius + 10, -3),
+                QPointF(-hsiCircleRadius + 10, +3),
+                QPointF(-rotatinghsiCircleRadius + 10, +3),
+            ]
         )
 
-        # Draw the fixed Horizontal Situation Indicator marker
+        # the arrow and bottom bar share the pen and brush of the deflection
+        # bar, they are drawn as a single path
+        self._cdiPath = QPainterPath()
+        self._cdiPath.addPolygon(self._cdiArrowPoly)
+        self._cdiPath.closeSubpath()
+        self._cdiPath.addPolygon(self._cdiBarPoly)
+        self._cdiPath.closeSubpath()
+
+        fromToTipX = 65
+        self._fromToPoly = QPolygonF(
+            [
+                QPointF(fromToTipX - 10, 0),
+                QPointF(fromToTipX - 40, -20),
+                QPointF(fromToTipX - 30, 0),
+                QPointF(fromToTipX - 40, 20),
+            ]
+        )
+
+        self._bugSymbolPoly = QPolygonF(
+            [
+                QPointF(381, 336),
+                QPointF(381, 354),
+                QPointF(387, 354),
+                QPointF(387, 349),
+                QPointF(382, 346),
+                QPointF(382, 344),
+                QPointF(387, 341),
+                QPointF(387, 336),
+            ]
+        )
+
+        self._windArrowPoly = QPolygonF(
+            [
+                QPointF(-5, 0),
+                QPointF(0, -10),
+                QPointF(5, 0),
+                QPointF(2, 0),
+                QPointF(2, 10),
+                QPointF(-2, 10),
+                QPointF(-2, 0),
+            ]
+        )
+
+        self._headingBoxPoly = QPolygonF(
+            [
+                QPointF(G5_CENTER_X - headingBoxWidth / 2, 1),
+                QPointF(G5_CENTER_X - headingBoxWidth / 2, headingBoxHeight),
+                QPointF(G5_CENTER_X - 6, headingBoxHeight),
+                QPointF(G5_CENTER_X, headingBoxHeight + 8),
+                QPointF(G5_CENTER_X + 6, headingBoxHeight),
+                QPointF(G5_CENTER_X + headingBoxWidth / 2, headingBoxHeight),
+                QPointF(G5_CENTER_X + headingBoxWidth / 2, 1),
+            ]
+        )
+
+        self._groundTrackPoly = QPolygonF(
+            [
+                QPointF(
+                    -groundTrackDiamondSize,
+                    -rotatinghsiCircleRadius - groundTrackDiamondSize,
+                ),
+                QPointF(
+                    +groundTrackDiamondSize,
+                    -rotatinghsiCircleRadius - groundTrackDiamondSize,
+                ),
+                QPointF(+0, -rotatinghsiCircleRadius),
+            ]
+        )
+
+        self._aircraftPoly = QPolygonF(
+            [
+                QPointF(240, 163),
+                QPointF(235, 169),
+                QPointF(235, 180),
+                QPointF(215, 195),
+                QPointF(215, 200),
+                QPointF(235, 195),
+                QPointF(235, 205),
+                QPointF(227, 213),
+                QPointF(227, 217),
+                QPointF(240, 213),
+                QPointF(253, 217),
+                QPointF(253, 213),
+                QPointF(245, 205),
+                QPointF(245, 195),
+                QPointF(265, 200),
+                QPointF(265, 195),
+                QPointF(245, 180),
+                QPointF(245, 169),
+            ]
+        )
+
+        # text areas of the readouts
+        crsBoxHeight = 30
+        crsBoxWidth = 105
+        self._cdiSourceRect = QRectF(G5_CENTER_X - 70, HSI_CENTER - 50, 65, 18)
+        self._cdiAnnunciatorRect = QRectF(G5_CENTER_X + 25, HSI_CENTER - 50, 65, 18)
+        self._headingBugRect = QRectF(412, 336, 65, 18)
+        self._distBoxRect = QRectF(G5_WIDTH - 105, 0, 105, 45)
+        self._distRect = QRectF(G5_WIDTH - 105, 12, 105, 45 - 12)
+        self._windDirectionRect = QRectF(50, 2, 50, 20)
+        self._windSpeedRect = QRectF(50, 22, 50, 20)
+        self._headingRect = QRectF(
+            G5_CENTER_X - headingBoxWidth / 2, 1, headingBoxWidth, headingBoxHeight
+        )
+        self._crsLabelRect = QRectF(
+            1, G5_HEIGHT - crsBoxHeight + 1, crsBoxWidth - 2, crsBoxHeight - 2
+        )
+        self._crsRect = QRectF(40, G5_HEIGHT - crsBoxHeight + 1, 65, crsBoxHeight - 2)
+
+        # fixed peripheral markers, a (0, 170) (0, 185) line rotated by -marker
         hsiPeripheralMarkers = [
             45,
             90,
@@ -374,29 +992,30 @@ class pyG5HSIWidget(pyG5Widget):
             270,
             315,
         ]
-        self.setPen(2, Qt.GlobalColor.white)
-
+        self._hsiPeripheralLines = []
         for marker in hsiPeripheralMarkers:
-            self.qp.rotate(-marker)
-            self.qp.drawLine(0, 170, 0, 185)
-            self.qp.rotate(marker)
-
-        # Draw the RotatingHSI lines and Text
+            markerCos, markerSin = TRIG_5DEG[marker]
+            self._hsiPeripheralLines.append(
+                QLineF(
+                    170 * markerSin, 170 * markerCos, 185 * markerSin, 185 * markerCos
+                )
+            )
 
-        # rotate by the current magnetic heading
-        self.qp.rotate(-self._magHeading)
+        self._cdiCirclesPath = QPainterPath()
+        for i in [-81, -41, 31, 69]:
+            self._cdiCirclesPath.addEllipse(QRectF(i, -6, 12, 12))
 
-        currentHead = 0
-        while currentHead < 360:
+        # rotating compass rose ticks and their label centers, in the rose frame
+        hsiTextRadius = 120
+        self._hsiTickLines = []
+        self._hsiTickLabels = []
+        for currentHead in range(0, 360, 5):
             if (currentHead % 90) == 0:
                 length = 20
             elif (currentHead % 10) == 0:
                 length = 15
             else:
                 length = 10
-            self.qp.drawLine(
-                0, rotatinghsiCircleRadius - length, 0, rotatinghsiCircleRadius
-            )
 
             if currentHead == 0:
                 text = "N"
@@ -407,371 +1026,354 @@ class pyG5HSIWidget(pyG5Widget):
             elif currentHead == 270:
                 text = "W"
             elif (currentHead % 30) == 0:
-                text = "{:2d}".format(int(currentHead / 10))
+                text = f"{int(currentHead / 10):2d}"
             else:
-                text = ""
-
-            if len(text):
-                self.qp.translate(0, -hsiTextRadius)
-                self.qp.rotate(+self._magHeading - currentHead)
-                self.qp.drawText(
-                    QRectF(
-                        -self.qp.font().pixelSize() / 2 - 3,
-                        -self.qp.font().pixelSize() / 2,
-                        self.qp.font().pixelSize() + 6,
-                        self.qp.font().pixelSize(),
-                    ),
-                    Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-                    text,
+                text = None
+
+            # same geometry as a vertical tick drawn after rotating the rose
+            cosHead, sinHead = TRIG_5DEG[currentHead]
+            self._hsiTickLines.append(
+                QLineF(
+                    -(rotatinghsiCircleRadius - length) * sinHead,
+                    (rotatinghsiCircleRadius - length) * cosHead,
+                    -rotatinghsiCircleRadius * sinHead,
+                    rotatinghsiCircleRadius * cosHead,
                 )
-                self.qp.rotate(-self._magHeading + currentHead)
-                self.qp.translate(0, hsiTextRadius)
-
-            self.qp.rotate(+5)
-            currentHead += 5
-
-        # draw the Heading bug
-        self.setPen(1, Qt.GlobalColor.cyan)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.cyan))
-
-        self.qp.rotate(180 + self._headingBug)
-
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(-9, rotatinghsiCircleRadius - 1),
-                    QPointF(+9, rotatinghsiCircleRadius - 1),
-                    QPointF(+9, rotatinghsiCircleRadius + 6),
-                    QPointF(+6, rotatinghsiCircleRadius + 6),
-                    QPointF(0, rotatinghsiCircleRadius + 1),
-                    QPointF(-6, rotatinghsiCircleRadius + 6),
-                    QPointF(-9, rotatinghsiCircleRadius + 6),
-                ]
             )
-        )
+            if text is not None:
+                self._hsiTickLabels.append(
+                    (QPointF(hsiTextRadius * sinHead, -hsiTextRadius * cosHead), text)
+                )
 
-        self.setPen(1, Qt.GlobalColor.black)
-
-        self.qp.setBrush(QBrush(self.nav_color))
-        # Draw the CDI
-        self.qp.rotate(90 - self._headingBug + self.nav_crs)
-
-        # CDI arrow
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(rotatinghsiCircleRadius - 10, 0),
-                    QPointF(rotatinghsiCircleRadius - 40, -20),
-                    QPointF(rotatinghsiCircleRadius - 33, -3),
-                    QPointF(hsiCircleRadius - 10, -3),
-                    QPointF(hsiCircleRadius - 10, 3),
-                    QPointF(rotatinghsiCircleRadius - 33, 3),
-                    QPointF(rotatinghsiCircleRadius - 40, 20),
-                ]
-            )
+        # the rose labels use the heading box font size
+        labelSize = headingBoxHeight - 2
+        self._hsiTickLabelRect = QRectF(
+            -labelSize / 2 - 3,
+            -labelSize / 2,
+            labelSize + 6,
+            labelSize,
         )
-        # CDI bottom bar
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(-rotatinghsiCircleRadius + 10, -3),
-                    QPointF(-hsiCircleRadius + 10, -3),
-                    QPointF(-hsiCircleRadius + 10, +3),
-                    QPointF(-rotatinghsiCircleRadius + 10, +3),
-                ]
-            )
-        )
-        # CDI deflection bar
-        if int(self.nav_from_to) != 0:
-            hsiDeflectionBound = hsiCircleRadius / 75 * 2
-            deflection = (
-                    max(min(self.nav_dft, hsiDeflectionBound), -hsiDeflectionBound) / 2 * 75
-            )
-            self.qp.drawPolygon(
-                QPolygonF(
-                    [
-                        QPointF(hsiCircleRadius - 10, deflection - 3),
-                        QPointF(-hsiCircleRadius + 10, deflection - 3),
-                        QPointF(-hsiCircleRadius + 10, deflection + 3),
-                        QPointF(hsiCircleRadius - 10, deflection + 3),
-                    ]
-                )
-            )
 
-            # NAV1 FromTo
-            fromToTipX = 65
-            if int(self.nav_from_to) == 2:
-                self.qp.rotate(180)
+    def resizeEvent(self, event):
+        """Invalidate the static layer on resize."""
+        self._staticLayer = None
+        pyG5Widget.resizeEvent(self, event)
 
-            self.qp.drawPolygon(
-                QPolygonF(
-                    [
-                        QPointF(fromToTipX - 10, 0),
-                        QPointF(fromToTipX - 40, -20),
-                        QPointF(fromToTipX - 30, 0),
-                        QPointF(fromToTipX - 40, 20),
-                    ]
-                )
-            )
-            if int(self.nav_from_to) == 2:
-                self.qp.rotate(180)
+    def buildStaticLayer(self):
+        """Render the parts of the HSI that never change.
 
-        self.qp.rotate(90)
-        # CDI deflection circle
-        self.setPen(2, Qt.GlobalColor.white)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.black))
+        The layer is drawn first on every repaint, only the elements lying
+        below or beside the dynamic ones are part of it.
 
-        for i in [-81, -41, 31, 69]:
-            self.qp.drawArc(
-                QRectF(
-                    i,
-                    -6,
-                    12,
-                    12,
-                ),
-                0,
-                360 * 16,
-            )
+        Returns:
+            QImage
+        """
+        hsiCircleRadius = 90
 
-        self.qp.resetTransform()
+        layer = self.newLayer()
 
-        font = self.qp.font()
-        font.setPixelSize(15)
-        font.setBold(False)
-        self.qp.setFont(font)
+        self.qp = QPainter(layer)
+
+        # Draw the background
+        self.qp.setPen(self._penBlack1)
+        self.qp.setBrush(self._brushBlack)
+        self.qp.drawRect(0, 0, G5_WIDTH, G5_HEIGHT)
 
-        self.setPen(2, self.nav_color)
+        # Draw the Horizontal Situation Indicator circle
+        self.qp.setPen(self._penGrey2)
 
-        self.qp.drawText(
-            QRectF(G5_CENTER_X - 70, HSI_CENTER - 50, 65, 18),
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-            self.cdi_source,
+        # offset the center to the Horizontal Situation Indicator center
+        self.qp.save()
+        self.qp.translate(G5_CENTER_X, HSI_CENTER)
+
+        self.qp.drawArc(
+            -hsiCircleRadius,
+            -hsiCircleRadius,
+            2 * hsiCircleRadius,
+            2 * hsiCircleRadius,
+            0,
+            360 * 16,
         )
 
-        if len(self.gps_cdi_annunciator):
-            self.qp.drawText(
-                QRectF(G5_CENTER_X + 25, HSI_CENTER - 50, 65, 18),
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                self.gps_cdi_annunciator,
-            )
+        # Draw the fixed Horizontal Situation Indicator marker
+        self.qp.setPen(self._penWhite2)
+        self.qp.drawLines(self._hsiPeripheralLines)
+
+        self.qp.restore()
 
         # Draw the heading Bug indicator bottom corner
-        self.setPen(2, Qt.GlobalColor.cyan)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.black))
+        self.qp.setPen(self._penCyan2)
+        self.qp.setBrush(self._brushBlack)
 
         headingWidth = 105
         headingHeigth = 30
         self.qp.drawRect(QRectF(G5_WIDTH, G5_HEIGHT, -headingWidth, -headingHeigth))
 
         # draw the bug symbol
-        self.setPen(1, Qt.GlobalColor.cyan)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.cyan))
-
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(381, 336),
-                    QPointF(381, 354),
-                    QPointF(387, 354),
-                    QPointF(387, 349),
-                    QPointF(382, 346),
-                    QPointF(382, 344),
-                    QPointF(387, 341),
-                    QPointF(387, 336),
-                ]
+        self.qp.setPen(self._penCyan1)
+        self.qp.setBrush(self._brushCyan)
+
+        self.qp.drawPolygon(self._bugSymbolPoly)
+
+        # draw the wind box
+        self.qp.setPen(self._penGrey2)
+        self.qp.setBrush(self._brushBlack)
+
+        self.qp.drawRect(0, 0, 105, 45)
+
+        # draw the CRS box
+        crsBoxHeight = 30
+        crsBoxWidth = 105
+
+        self.qp.drawRect(QRectF(0, G5_HEIGHT - crsBoxHeight, crsBoxWidth, crsBoxHeight))
+
+        self.qp.end()
+
+        return layer
+
+    def paintEvent(self, event):
+        """Paint the widget."""
+        self.derive_settings()
+
+        if self._avionicson == 0:
+            self.paintAvionicsOff()
+            return
+
+        if self._staticLayer is None:
+            self._staticLayer = self.buildStaticLayer()
+
+        self.qp = QPainter(self)
+
+        rotatinghsiCircleRadius = 160
+        hsiCircleRadius = 90
+
+        headingBoxHeight = 22
+
+        self.qp.setFont(self.pixelFont(headingBoxHeight - 2, True))
+
+        # background, HSI circle, fixed markers and box frames. The layer is
+        # opaque, copy it instead of blending it
+        self.qp.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        self.qp.drawImage(0, 0, self._staticLayer)
+        self.qp.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
+        # the compass rose and everything drawn on it are skipped when only
+        # the readout boxes are repainted
+        rose = event.region().intersects(self._roseRegion)
+
+        if rose:
+            # offset the center to the Horizontal Situation Indicator center
+            self.qp.save()
+            self.qp.translate(G5_CENTER_X, HSI_CENTER)
+
+            self.qp.setPen(self._penWhite2)
+
+            # Draw the RotatingHSI lines and Text
+
+            # the labels stay upright, only their center follows the rose.
+            # They do not overlap the ticks and are drawn before rotating.
+            roseRotation = QTransform()
+            roseRotation.rotate(-self._magHeading)
+            labelRect = self._hsiTickLabelRect
+            labelAlignment = (
+                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter
             )
-        )
+            for center, text in self._hsiTickLabels:
+                self.drawStaticText(
+                    labelRect.translated(roseRotation.map(center)), labelAlignment, text
+                )
+
+            # rotate by the current magnetic heading
+            if self._magHeading:
+                self.qp.rotate(-self._magHeading)
+
+            self.qp.drawLines(self._hsiTickLines)
+
+            # draw the Heading bug
+            self.qp.setPen(self._penCyan1)
+            self.qp.setBrush(self._brushCyan)
+
+            headingBugRotation = 180 + self._headingBug
+            if headingBugRotation:
+                self.qp.rotate(headingBugRotation)
+
+            self.qp.drawPolygon(self._headingBugPoly)
+
+            self.qp.setPen(self._penBlack1)
+
+            self.qp.setBrush(self._brushNav)
+            # Draw the CDI
+            cdiRotation = 90 - self._headingBug + self.nav_crs
+            if cdiRotation:
+                self.qp.rotate(cdiRotation)
+
+            if self.nav_from_to == 0:
+                # CDI arrow and bottom bar
+                self.qp.drawPath(self._cdiPath)
+            else:
+                # CDI arrow, bottom bar and deflection bar
+                hsiDeflectionBound = self._hsiDeflectionBound
+                deflection = (
+                    max(min(self.nav_dft, hsiDeflectionBound), -hsiDeflectionBound)
+                    * self._cdiPixelPerDot
+                )
+                cdiPath = QPainterPath(self._cdiPath)
+                cdiPath.addRect(
+                    QRectF(
+                        -hsiCircleRadius + 10,
+                        deflection - 3,
+                        2 * hsiCircleRadius - 20,
+                        6,
+                    )
+                )
+                self.qp.drawPath(cdiPath)
+
+                # NAV1 FromTo
+                if self.nav_from_to == 2:
+                    self.qp.rotate(180)
+
+                self.qp.drawPolygon(self._fromToPoly)
+                if self.nav_from_to == 2:
+                    self.qp.rotate(180)
+
+            self.qp.rotate(90)
+            # CDI deflection circle, outlined only as the arcs they replace
+            self.qp.setPen(self._penWhite2)
+            self.qp.setBrush(self._brushNone)
+
+            self.qp.drawPath(self._cdiCirclesPath)
+
+            self.qp.restore()
+
+            self.qp.setFont(self.pixelFont(15, False))
+
+            self.qp.setPen(self._penNav2)
+
+            self.drawStaticText(
+                self._cdiSourceRect,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                self.cdi_source,
+            )
+
+            if len(self.gps_cdi_annunciator):
+                self.drawStaticText(
+                    self._cdiAnnunciatorRect,
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                    self.gps_cdi_annunciator,
+                )
+
+        # draw the heading bug value
+        self.qp.setPen(self._penCyan1)
 
         self.qp.drawText(
-            QRectF(412, 336, 65, 18),
+            self._headingBugRect,
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-            "{:03d}˚".format(int(self._headingBug)),
+            formatDegrees(self._headingBug),
         )
 
         # draw the dist box
-        if int(self._hsiSource) == 2:
-            font.setPixelSize(12)
-            font.setBold(False)
-            self.qp.setFont(font)
-            distRect = QRectF(G5_WIDTH - 105, 0, 105, 45)
-
-            self.setPen(2, GREY_COLOR)
-            self.qp.setBrush(QBrush(Qt.GlobalColor.black))
-            self.qp.drawRect(distRect)
-
-            self.qp.drawText(
-                distRect,
+        if self.hsi_source == 2:
+            self.qp.setFont(self.pixelFont(12, False))
+            self.qp.setPen(self._penGrey2)
+            self.qp.setBrush(self._brushBlack)
+            self.qp.drawRect(self._distBoxRect)
+
+            self.drawStaticText(
+                self._distBoxRect,
                 Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
                 "Dist NM",
             )
 
-            font.setPixelSize(18)
-            font.setBold(True)
-            self.qp.setFont(font)
-            self.setPen(1, self.nav_color)
+            self.qp.setFont(self.pixelFont(18, True))
+            self.qp.setPen(self._penNav1)
 
-            distRect = QRectF(G5_WIDTH - 105, 12, 105, 45 - 12)
             self.qp.drawText(
-                distRect,
+                self._distRect,
                 Qt.AlignmentFlag.AlignCenter,
-                "{}".format(round(self._gpsdmedist, 1)),
+                str(round(self._gpsdmedist, 1)),
             )
 
         # set default font size
-        font = self.qp.font()
-        font.setPixelSize(18)
-        font.setBold(True)
-        self.qp.setFont(font)
-
-        # draw the wind box
-        self.setPen(2, GREY_COLOR)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.black))
-
-        self.qp.drawRect(0, 0, 105, 45)
+        self.qp.setFont(self.pixelFont(18, True))
 
-        self.setPen(1, Qt.GlobalColor.white)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.white))
+        # draw the wind direction and speed
+        self.qp.setPen(self._penWhite1)
+        self.qp.setBrush(self._brushWhite)
 
+        self.qp.save()
         self.qp.translate(25, 25)
 
-        self.qp.rotate(180 - self._magHeading + self._windDirection)
-
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(-5, 0),
-                    QPointF(0, -10),
-                    QPointF(5, 0),
-                    QPointF(2, 0),
-                    QPointF(2, 10),
-                    QPointF(-2, 10),
-                    QPointF(-2, 0),
-                ]
-            )
-        )
+        windRotation = 180 - self._magHeading + self._windDirection
+        if windRotation:
+            self.qp.rotate(windRotation)
+
+        self.qp.drawPolygon(self._windArrowPoly)
 
-        self.qp.resetTransform()
+        self.qp.restore()
 
         self.qp.drawText(
-            QRectF(50, 2, 50, 20),
+            self._windDirectionRect,
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-            "{:03d}˚".format(int(self._windDirection)),
+            formatDegrees(self._windDirection),
         )
 
         self.qp.drawText(
-            QRectF(50, 22, 50, 20),
+            self._windSpeedRect,
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-            "{:02d}kt".format(int(self._windSpeed * mstokt)),
+            formatKnots(self._windSpeed * mstokt),
         )
 
         # Draw the magnetic heading box
-        self.setPen(2, GREY_COLOR)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.black))
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(G5_CENTER_X - headingBoxWidth / 2, 1),
-                    QPointF(G5_CENTER_X - headingBoxWidth / 2, headingBoxHeight),
-                    QPointF(G5_CENTER_X - 6, headingBoxHeight),
-                    QPointF(G5_CENTER_X, headingBoxHeight + 8),
-                    QPointF(G5_CENTER_X + 6, headingBoxHeight),
-                    QPointF(G5_CENTER_X + headingBoxWidth / 2, headingBoxHeight),
-                    QPointF(G5_CENTER_X + headingBoxWidth / 2, 1),
-                ]
-            )
-        )
+        self.qp.setPen(self._penGrey2)
+        self.qp.setBrush(self._brushBlack)
+        self.qp.drawPolygon(self._headingBoxPoly)
 
         self.qp.drawText(
-            QRectF(
-                G5_CENTER_X - headingBoxWidth / 2, 1, headingBoxWidth, headingBoxHeight
-            ),
+            self._headingRect,
             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-            "{:03d}˚".format(int(self._magHeading)),
+            formatDegrees(self._magHeading),
         )
 
-        # Draw the ground track
-        self.setPen(0, Qt.GlobalColor.transparent)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.magenta))
-        self.qp.translate(G5_CENTER_X, HSI_CENTER)
-        self.qp.rotate(-self._magHeading + self._groundTrack)
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(
-                        -groundTrackDiamondSize,
-                        -rotatinghsiCircleRadius - groundTrackDiamondSize,
-                    ),
-                    QPointF(
-                        +groundTrackDiamondSize,
-                        -rotatinghsiCircleRadius - groundTrackDiamondSize,
-                    ),
-                    QPointF(+0, -rotatinghsiCircleRadius),
-                ]
-            )
-        )
-        self.setPen(3, GREY_COLOR, Qt.PenStyle.DashLine)
-        self.qp.drawLine(0, 0, 0, -rotatinghsiCircleRadius)
-        self.qp.resetTransform()
-
-        # draw the aircraft
-        self.setPen(1, Qt.GlobalColor.white)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.white))
-
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(240, 163),
-                    QPointF(235, 169),
-                    QPointF(235, 180),
-                    QPointF(215, 195),
-                    QPointF(215, 200),
-                    QPointF(235, 195),
-                    QPointF(235, 205),
-                    QPointF(227, 213),
-                    QPointF(227, 217),
-                    QPointF(240, 213),
-                    QPointF(253, 217),
-                    QPointF(253, 213),
-                    QPointF(245, 205),
-                    QPointF(245, 195),
-                    QPointF(265, 200),
-                    QPointF(265, 195),
-                    QPointF(245, 180),
-                    QPointF(245, 169),
-                ]
-            )
-        )
+        if rose:
+            # Draw the ground track
+            self.qp.setPen(self._penTransparent)
+            self.qp.setBrush(self._brushMagenta)
+            self.qp.save()
+            self.qp.translate(G5_CENTER_X, HSI_CENTER)
+            groundTrackRotation = -self._magHeading + self._groundTrack
+            if groundTrackRotation:
+                self.qp.rotate(groundTrackRotation)
+            self.qp.drawPolygon(self._groundTrackPoly)
+            self.qp.setPen(self._penGrey3Dash)
+            self.qp.drawLine(0, 0, 0, -rotatinghsiCircleRadius)
+            self.qp.restore()
+
+            # draw the aircraft
+            self.qp.setPen(self._penWhite1)
+            self.qp.setBrush(self._brushWhite)
+
+            self.qp.drawPolygon(self._aircraftPoly)
 
         self.draw_glideslope()
 
         # draw the CRS selection
+        self.qp.setPen(self._penWhite1)
 
-        crsBoxHeight = 30
-        crsBoxWidth = 105
-
-        self.setPen(2, GREY_COLOR)
-        self.qp.setBrush(QBrush(Qt.GlobalColor.black))
-
-        rect = QRectF(0, G5_HEIGHT - crsBoxHeight, crsBoxWidth, crsBoxHeight)
-        self.qp.drawRect(rect)
+        self.qp.setFont(self.pixelFont(15, True))
 
-        self.setPen(1, Qt.GlobalColor.white)
-
-        font = self.qp.font()
-        font.setPixelSize(15)
-        self.qp.setFont(font)
-
-        rect = QRectF(1, G5_HEIGHT - crsBoxHeight + 1, crsBoxWidth - 2, crsBoxHeight - 2)
-        self.qp.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom, "CRS")
+        self.drawStaticText(
+            self._crsLabelRect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+            "CRS",
+        )
 
-        font = self.qp.font()
-        font.setPixelSize(25)
-        self.qp.setFont(font)
+        self.qp.setFont(self.pixelFont(25, True))
 
-        self.setPen(1, self.nav_color)
-        rect = QRectF(40, G5_HEIGHT - crsBoxHeight + 1, 65, crsBoxHeight - 2)
+        self.qp.setPen(self._penNav1)
         self.qp.drawText(
-            rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "{:03d}˚".format(int(self.nav_crs))
+            self._crsRect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            formatDegrees(self.nav_crs),
         )
 
         self.qp.end()
@@ -792,135 +1394,93 @@ class pyG5AIWidget(pyG5Widget):
         pyG5Widget.__init__(self, parent)
 
         # parameters
+        self._staticLayer = None
+
         self.rollArcRadius = G5_CENTER_Y * 0.8
         self._pitchScale = 25
-
-    def paintEvent(self, event):
-        """Paint the widget."""
-        self.derive_settings()
-        diamondHeight = 14
-        diamondHeight = 14
-        diamondWidth = 14
-
-        self.qp = QPainter(self)
-
-        if self._avionicson == 0:
-            self.setPen(1, Qt.GlobalColor.black)
-            self.qp.setBrush(QBrush(Qt.GlobalColor.black))
-            self.qp.drawRect(0, 0, G5_WIDTH, G5_HEIGHT)
-            self.setPen(1, Qt.GlobalColor.white)
-            self.qp.drawLine(0, 0, G5_WIDTH, G5_HEIGHT)
-            self.qp.drawLine(0, G5_HEIGHT, G5_WIDTH, 0)
-            self.qp.end()
-            return
-
-        # set default font size
-        font = self.qp.font()
-        font.setPixelSize(6)
-        font.setBold(True)
-        self.qp.setFont(font)
-
-        self.setPen(1, Qt.GlobalColor.white)
-        grad = QLinearGradient(G5_CENTER_X, G5_HEIGHT, G5_CENTER_X, 0)
-        grad.setColorAt(1, QColor(0, 50, 200, 255))
-        grad.setColorAt(0, QColor(0, 255, 255, 255))
-        self.qp.setBrush(grad)
-
-        # draw contour + backgorun sky
-        self.qp.drawRect(QRectF(0, 0, G5_WIDTH, G5_HEIGHT))
-
-        # draw the rotating part depending on the roll angle
-        self.qp.translate(G5_CENTER_X, G5_CENTER_Y)
-        self.qp.rotate(-self._rollAngle)
-
-        # draw the ground
-        grad = QLinearGradient(
-            G5_CENTER_X,
-            +self._pitchAngle / self._pitchScale * G5_CENTER_Y,
-            G5_CENTER_X,
-            +g5Diag,
-        )
-        grad.setColorAt(0, QColor(152, 103, 45))
-        grad.setColorAt(1, QColor(255, 222, 173))
-        self.qp.setBrush(grad)
-
-        self.qp.drawRect(
-            QRectF(
-                QPointF(
-                    -g5Diag,
-                    +self._pitchAngle / self._pitchScale * G5_CENTER_Y,
-                ),
-                QPointF(
-                    +g5Diag,
-                    +g5Diag,
-                ),
-            )
-        )
-
-        # draw the pitch lines
-        height = 0
-        pitch = 0
-        width = [10, 20, 10, 30]
-        mode = 0
-        while height < self.rollArcRadius - 40:
-            pitch += 2.5
-            height = (
-                    pitch / self._pitchScale * G5_CENTER_Y
-                    + self._pitchAngle / self._pitchScale * G5_CENTER_Y
-            )
-            self.qp.drawLine(
-                QPointF(
-                    -width[mode],
-                    height,
-                ),
-                QPointF(
-                    width[mode],
-                    height,
-                ),
-            )
-            if width[mode] == 30:
-                self.qp.drawText(QPoint(30 + 3, int(height + 2)), str(int(pitch)))
-                self.qp.drawText(QPoint(-40, int(height + 2)), str(int(pitch)))
-            mode = (mode + 1) % 4
-
-        height = 0
-        pitch = 0
-        width = [10, 20, 10, 30]
-        mode = 0
-        while height > -self.rollArcRadius + 30:
-            pitch -= 2.5
-            height = (
-                    pitch / self._pitchScale * G5_CENTER_Y
-                    + self._pitchAngle / self._pitchScale * G5_CENTER_Y
-            )
-            self.qp.drawLine(
-                QPointF(
-                    -width[mode],
-                    height,
-                ),
-                QPointF(
-                    width[mode],
-                    height,
-                ),
-            )
-            if width[mode] == 30:
-                self.qp.drawText(QPoint(30 + 3, int(height + 2)), str(abs(int(pitch))))
-                self.qp.drawText(QPoint(-40, int(height + 2)), str(abs(int(pitch))))
-
-            mode = (mode + 1) % 4
-
-        # draw the static roll arc
-        self.setPen(3, Qt.GlobalColor.white)
-
-        bondingRect = QRectF(
-            -self.rollArcRadius,
-            -self.rollArcRadius,
-            2 * self.rollArcRadius,
-            2 * self.rollArcRadius,
+        self._pitchPixelPerDegree = G5_CENTER_Y / self._pitchScale
+
+        # sky and ground gradients, the ground start is moved with the pitch
+        skyGrad = QLinearGradient(G5_CENTER_X, G5_HEIGHT, G5_CENTER_X, 0)
+        skyGrad.setColorAt(1, QColor(0, 50, 200, 255))
+        skyGrad.setColorAt(0, QColor(0, 255, 255, 255))
+        self._skyBrush = QBrush(skyGrad)
+
+        # attitude indicator specific pens and brushes
+        self._penWhite3 = makePen(3, Qt.GlobalColor.white)
+        self._penMagenta1 = makePen(1, Qt.GlobalColor.magenta)
+        self._penTurnScale = makePen(1, QColor(0, 0, 0, 127))
+        self._penTurnMarker = makePen(1, QColor(255, 255, 255, 128))
+        self._penSlipMarker = makePen(2, QColor(0, 0, 0, 128))
+
+        self._brushYellow = QBrush(Qt.GlobalColor.yellow)
+        self._brushRed = QBrush(Qt.GlobalColor.red)
+        self._brushGreen = QBrush(Qt.GlobalColor.green)
+        self._brushCross = QBrush(QColor(0x7E, 0x7E, 0x34, 255))
+        self._brushShade = QBrush(QColor(0, 0, 0, 90))
+        self._brushSlipMarker = QBrush(QColor(220, 220, 220))
+
+        # slip ball gradient around the origin, translated to the ball
+        slipBallGrad = QRadialGradient(0, 0, 15, 0, 0)
+        slipBallGrad.setColorAt(0, QColor(255, 255, 255, 200))
+        slipBallGrad.setColorAt(1, QColor(160, 160, 160, 200))
+        self._slipBallBrush = QBrush(slipBallGrad)
+
+        # side panels, the TAS text is wider than the speed tape
+        self._speedTapeRect = QRect(0, 0, 120, G5_HEIGHT)
+        self._altitudeTapeRect = QRect(G5_WIDTH - 100, 0, 100, G5_HEIGHT)
+        self._turnCoordinatorRect = QRect(0, G5_HEIGHT - 57, G5_WIDTH, 57)
+
+        self._displayedProperties = GLIDESLOPE_PROPERTIES | frozenset(
+            [
+                "_avionicson",
+                "_rollAngle",
+                "_pitchAngle",
+                "_gs",
+                "_kias",
+                "_kiasDelta",
+                "_ktas",
+                "_altitude",
+                "_alt_setting",
+                "_vh_ind_fpm",
+                "_turnRate",
+                "_slip",
+                "_vs",
+                "_vs0",
+                "_vfe",
+                "_vno",
+                "_vne",
+            ]
         )
-        self.qp.drawArc(bondingRect, 30 * 16, 120 * 16)
 
-        # draw the Roll angle arc markers
+        # readouts drawn in their own box and panel only properties
+        self._dirtyRects = {
+            "_ktas": QRect(0, 0, 120, 32),
+            "_gs": QRect(0, G5_HEIGHT - 32, 99, 32),
+            "_alt_setting": QRect(G5_WIDTH - 99, G5_HEIGHT - 32, 99, 32),
+            "_kias": self._speedTapeRect,
+            "_kiasDelta": self._speedTapeRect,
+            "_vs": self._speedTapeRect,
+            "_vs0": self._speedTapeRect,
+            "_vfe": self._speedTapeRect,
+            "_vno": self._speedTapeRect,
+            "_vne": self._speedTapeRect,
+            "_altitude": self._altitudeTapeRect,
+            "_vh_ind_fpm": self._altitudeTapeRect,
+            "_turnRate": self._turnCoordinatorRect,
+            "_slip": self._turnCoordinatorRect,
+        }
+
+        self._groundGrad = QLinearGradient(G5_CENTER_X, 0, G5_CENTER_X, g5Diag)
+        self._groundGrad.setColorAt(0, QColor(152, 103, 45))
+        self._groundGrad.setColorAt(1, QColor(255, 222, 173))
+
+        # ground rectangle and brush, and the pitch offset they start at
+        self._groundRect = None
+        self._groundBrush = None
+        self._groundBrushOffset = None
+
+        # roll angle arc markers: (angle, length)
         rollangleindicator = [
             [-30, 10],
             [-45, 5],
@@ -933,32 +1493,54 @@ class pyG5AIWidget(pyG5Widget):
             [-110, 5],
             [-120, 10],
         ]
+        self._rollMarkerLines = [
+            self.alongRadiusCoord(angle, length) for angle, length in rollangleindicator
+        ]
 
-        self.qp.setBrush(QBrush(Qt.GlobalColor.white))
-        self.setPen(2, Qt.GlobalColor.white)
-        for lineParam in rollangleindicator:
-            self.qp.drawLine(self.alongRadiusCoord(lineParam[0], lineParam[1]))
+        # pitch ladder at zero pitch, from the horizon outwards, long enough
+        # to cover the +/-90 degrees pitch range: line distances to the
+        # horizon, lines and (index, height, label) of the labeled lines
+        pitchLimit = self.rollArcRadius + 90 * self._pitchPixelPerDegree
+        width = [10, 20, 10, 30]
+        self._pitchLadderUp = ([], [], [])
+        self._pitchLadderDown = ([], [], [])
+        for ladder, step in [(self._pitchLadderUp, 2.5), (self._pitchLadderDown, -2.5)]:
+            distances, lines, labels = ladder
+            height = 0
+            pitch = 0
+            mode = 0
+            while abs(height) < pitchLimit:
+                pitch += step
+                height = pitch * self._pitchPixelPerDegree
+                if width[mode] == 30:
+                    labels.append((len(lines), height, str(abs(int(pitch)))))
+                distances.append(abs(height))
+                lines.append(QLineF(-width[mode], height, width[mode], height))
+                mode = (mode + 1) % 4
+
+        self.buildStaticGeometry()
+
+    def buildStaticGeometry(self):
+        """Build the polygons that do not depend on the state.
+
+        The roll diamond is stored in the rotated frame centered on the
+        widget, all the others in widget coordinates.
+        """
+        diamondHeight = 14
+        diamondWidth = 14
 
-        self.setPen(1, Qt.GlobalColor.white)
-        # draw the diamond on top of the roll arc
-        self.qp.drawPolygon(
-            QPolygonF(
-                [
-                    QPointF(
-                        0,
-                        -self.rollArcRadius - 2,
-                    ),
-                    QPointF(-diamondWidth / 2, -self.rollArcRadius - diamondHeight),
-                    QPointF(+diamondWidth / 2, -self.rollArcRadius - diamondHeight),
-                ]
-            )
+        self._rollDiamond = QPolygonF(
+            [
+                QPointF(
+                    0,
+                    -self.rollArcRadius - 2,
+                ),
+                QPointF(-diamondWidth / 2, -self.rollArcRadius - diamondHeight),
+                QPointF(+diamondWidth / 2, -self.rollArcRadius - diamondHeight),
+            ]
         )
 
-        self.qp.resetTransform()
-
-        # create the fixed diamond
-
-        fixedDiamond = QPolygonF(
+        self._fixedDiamond = QPolygonF(
             [
                 QPointF(G5_CENTER_X, G5_CENTER_Y - self.rollArcRadius + 2),
                 QPointF(
@@ -972,36 +1554,24 @@ class pyG5AIWidget(pyG5Widget):
             ]
         )
 
-        self.qp.drawPolygon(fixedDiamond)
-
-        # create the nose
-        self.qp.setBrush(QBrush(Qt.GlobalColor.yellow))
-        self.qp.setBackgroundMode(Qt.BGMode.OpaqueMode)
-
-        self.setPen(1, Qt.GlobalColor.black)
-
-        # solid polygon left
-        nose = QPolygonF(
+        # aircraft nose, solid part
+        self._noseLeft = QPolygonF(
             [
                 QPointF(G5_CENTER_X - 1, G5_CENTER_Y + 1),
                 QPointF(G5_CENTER_X - 75, G5_CENTER_Y + 38),
                 QPointF(G5_CENTER_X - 54, G5_CENTER_Y + 38),
             ]
         )
-        self.qp.drawPolygon(nose)
-
-        # solid polygon right
-        nose = QPolygonF(
+        self._noseRight = QPolygonF(
             [
                 QPointF(G5_CENTER_X + 1, G5_CENTER_Y + 1),
                 QPointF(G5_CENTER_X + 75, G5_CENTER_Y + 38),
                 QPointF(G5_CENTER_X + 54, G5_CENTER_Y + 38),
             ]
         )
-        self.qp.drawPolygon(nose)
 
-        # solid marker left
-        marker = QPolygonF(
+        # wing markers
+        self._markerLeft = QPolygonF(
             [
                 QPointF(120, G5_CENTER_Y - 5),
                 QPointF(155, G5_CENTER_Y - 5),
@@ -1010,10 +1580,7 @@ class pyG5AIWidget(pyG5Widget):
                 QPointF(120, G5_CENTER_Y + 5),
             ]
         )
-        self.qp.drawPolygon(marker)
-
-        # solid marker right
-        marker = QPolygonF(
+        self._markerRight = QPolygonF(
             [
                 QPointF(360, G5_CENTER_Y - 5),
                 QPointF(325, G5_CENTER_Y - 5),
@@ -1022,34 +1589,25 @@ class pyG5AIWidget(pyG5Widget):
                 QPointF(360, G5_CENTER_Y + 5),
             ]
         )
-        self.qp.drawPolygon(marker)
 
-        brush = QBrush(QColor(0x7E, 0x7E, 0x34, 255))
-        self.qp.setBrush(brush)
-
-        # cross pattern polygon left
-        nose = QPolygonF(
+        # aircraft nose, cross pattern part
+        self._crossLeft = QPolygonF(
             [
                 QPointF(G5_CENTER_X - 2, G5_CENTER_Y + 2),
                 QPointF(G5_CENTER_X - 33, G5_CENTER_Y + 38),
                 QPointF(G5_CENTER_X - 54, G5_CENTER_Y + 38),
             ]
         )
-        self.qp.drawPolygon(nose)
-
-        # cross pattern polygon right
-        nose = QPolygonF(
+        self._crossRight = QPolygonF(
             [
                 QPointF(G5_CENTER_X + 2, G5_CENTER_Y + 2),
                 QPointF(G5_CENTER_X + 33, G5_CENTER_Y + 38),
                 QPointF(G5_CENTER_X + 54, G5_CENTER_Y + 38),
             ]
         )
-        self.qp.drawPolygon(nose)
 
-        self.setPen(0, Qt.GlobalColor.transparent)
-        # solid polygon right
-        nose = QPolygonF(
+        # wing markers, shaded lower half
+        self._solidLeft = QPolygonF(
             [
                 QPointF(120, G5_CENTER_Y),
                 QPointF(160, G5_CENTER_Y),
@@ -1057,9 +1615,7 @@ class pyG5AIWidget(pyG5Widget):
                 QPointF(120, G5_CENTER_Y + 5),
             ]
         )
-        self.qp.drawPolygon(nose)
-        # solid polygon right
-        nose = QPolygonF(
+        self._solidRight = QPolygonF(
             [
                 QPointF(360, G5_CENTER_Y),
                 QPointF(320, G5_CENTER_Y),
@@ -1067,261 +1623,166 @@ class pyG5AIWidget(pyG5Widget):
                 QPointF(360, G5_CENTER_Y + 5),
             ]
         )
-        self.qp.drawPolygon(nose)
-
-        #################################################
-        # SPEED TAPE
-        #################################################
 
         speedBoxLeftAlign = 7
         speedBoxHeight = 50
         speedBoxWdith = 75
         speedBoxSpikedimension = 10
-        tasHeight = 30
-        speedDeltaWidth = 4
 
-        tapeScale = 50
+        self._speedBox = QPolygonF(
+            [
+                QPointF(speedBoxLeftAlign, G5_CENTER_Y + speedBoxHeight / 2),
+                QPointF(
+                    speedBoxLeftAlign + speedBoxWdith, G5_CENTER_Y + speedBoxHeight / 2
+                ),
+                QPointF(
+                    speedBoxLeftAlign + speedBoxWdith,
+                    G5_CENTER_Y + speedBoxSpikedimension,
+                ),
+                QPointF(
+                    speedBoxLeftAlign + speedBoxWdith + speedBoxSpikedimension,
+                    G5_CENTER_Y,
+                ),
+                QPointF(
+                    speedBoxLeftAlign + speedBoxWdith,
+                    G5_CENTER_Y - speedBoxSpikedimension,
+                ),
+                QPointF(
+                    speedBoxLeftAlign + speedBoxWdith, G5_CENTER_Y - speedBoxHeight / 2
+                ),
+                QPointF(speedBoxLeftAlign, G5_CENTER_Y - speedBoxHeight / 2),
+            ]
+        )
 
-        self.setPen(0, Qt.GlobalColor.transparent)
-
-        self.qp.setBrush(QBrush(QColor(0, 0, 0, 90)))
-        self.qp.drawRect(QRectF(0, 0, speedBoxLeftAlign + speedBoxWdith + 15, G5_HEIGHT))
-
-        if (self._kias + tapeScale / 2) > self._vne:
-            brush = QBrush(QColor(Qt.GlobalColor.red))
-            self.qp.setBrush(brush)
-
-            self.qp.drawRect(
-                QRectF(
-                    speedBoxLeftAlign + speedBoxWdith + 8,
-                    0,
-                    8,
-                    (1 - 2 * (self._vne - self._kias) / tapeScale) * G5_CENTER_Y,
-                )
-            )
-
-        if (self._kias + tapeScale / 2) > self._vno:
-            brush = QBrush(QColor(Qt.GlobalColor.yellow))
-            self.qp.setBrush(brush)
-
-            self.qp.drawRect(
-                QRectF(
-                    speedBoxLeftAlign + speedBoxWdith + 8,
-                    (1 - 2 * (self._vne - self._kias) / tapeScale) * G5_CENTER_Y,
-                    8,
-                    (2 * (self._vne - self._vno) / tapeScale) * G5_CENTER_Y,
-                )
-            )
-
-        if (self._kias + tapeScale / 2) > self._vs:
-            brush = QBrush(QColor(Qt.GlobalColor.green))
-            self.qp.setBrush(brush)
-            self.qp.drawRect(
-                QRectF(
-                    speedBoxLeftAlign + speedBoxWdith + 8,
-                    max(0, (1 - 2 * (self._vno - self._kias) / tapeScale) * G5_CENTER_Y),
-                    8,
-                    (1 - 2 * (self._vs - self._kias) / tapeScale) * G5_CENTER_Y,
-                )
-            )
-
-        if (self._kias + tapeScale / 2) > self._vs:
-            brush = QBrush(QColor(Qt.GlobalColor.white))
-            self.qp.setBrush(brush)
-            self.qp.drawRect(
-                QRectF(
-                    speedBoxLeftAlign + speedBoxWdith + 13,
-                    max(0, (1 - 2 * (self._vfe - self._kias) / tapeScale) * G5_CENTER_Y),
-                    3,
-                    (1 - 2 * (self._vs0 - self._kias) / tapeScale) * G5_CENTER_Y,
-                )
-            )
-
-        self.setPen(2, Qt.GlobalColor.white)
-
-        self.qp.setBackgroundMode(Qt.BGMode.TransparentMode)
-        font = self.qp.font()
-        font.setPixelSize(speedBoxHeight - 15)
-
-        # set default font size
-        self.qp.setFont(font)
-
-        currentTape = int(self._kias + tapeScale / 2)
-        while currentTape > max(0, self._kias - tapeScale / 2):
-            if (currentTape % 10) == 0:
-
-                tapeHeight = (
-                                     1 - 2 * (currentTape - self._kias) / tapeScale
-                             ) * G5_CENTER_Y
-                self.qp.drawLine(
-                    QPointF(speedBoxLeftAlign + speedBoxWdith + 5, tapeHeight),
-                    QPointF(speedBoxLeftAlign + speedBoxWdith + 15, tapeHeight),
-                )
-
-                self.qp.drawText(
-                    QRectF(
-                        speedBoxLeftAlign,
-                        tapeHeight - speedBoxHeight / 2,
-                        speedBoxWdith,
-                        speedBoxHeight,
-                    ),
-                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                    "{:d}".format(int(currentTape)),
-                )
-
-            elif (currentTape % 5) == 0:
-                self.qp.drawLine(
-                    QPointF(
-                        speedBoxLeftAlign + speedBoxWdith + 8,
-                        (1 - 2 * (currentTape - self._kias) / tapeScale) * G5_CENTER_Y,
-                    ),
-                    QPointF(
-                        speedBoxLeftAlign + speedBoxWdith + 15,
-                        (1 - 2 * (currentTape - self._kias) / tapeScale) * G5_CENTER_Y,
-                    ),
-                )
-
-            currentTape -= 1
+        altBoxRightAlign = 7
+        altBoxHeight = 30
+        altBoxWdith = 75
+        altBoxSpikedimension = 10
+        altTapeLeftAlign = G5_WIDTH - altBoxRightAlign - altBoxWdith
 
-        speedBox = QPolygonF(
+        self._altBox = QPolygonF(
             [
-                QPointF(speedBoxLeftAlign, G5_CENTER_Y + speedBoxHeight / 2),
+                QPointF(G5_WIDTH - altBoxRightAlign, G5_CENTER_Y - altBoxHeight / 2),
                 QPointF(
-                    speedBoxLeftAlign + speedBoxWdith, G5_CENTER_Y + speedBoxHeight / 2
+                    altTapeLeftAlign,
+                    G5_CENTER_Y - altBoxHeight / 2,
                 ),
                 QPointF(
-                    speedBoxLeftAlign + speedBoxWdith,
-                    G5_CENTER_Y + speedBoxSpikedimension,
+                    altTapeLeftAlign,
+                    G5_CENTER_Y - altBoxSpikedimension,
                 ),
                 QPointF(
-                    speedBoxLeftAlign + speedBoxWdith + speedBoxSpikedimension,
+                    altTapeLeftAlign - altBoxSpikedimension,
                     G5_CENTER_Y,
                 ),
                 QPointF(
-                    speedBoxLeftAlign + speedBoxWdith,
-                    G5_CENTER_Y - speedBoxSpikedimension,
+                    altTapeLeftAlign,
+                    G5_CENTER_Y + altBoxSpikedimension,
                 ),
                 QPointF(
-                    speedBoxLeftAlign + speedBoxWdith, G5_CENTER_Y - speedBoxHeight / 2
+                    altTapeLeftAlign,
+                    G5_CENTER_Y + altBoxHeight / 2,
                 ),
-                QPointF(speedBoxLeftAlign, G5_CENTER_Y - speedBoxHeight / 2),
+                QPointF(G5_WIDTH - altBoxRightAlign, G5_CENTER_Y + altBoxHeight / 2),
             ]
         )
 
-        self.setPen(2, Qt.GlobalColor.white)
+    def resizeEvent(self, event):
+        """Invalidate the static layer on resize."""
+        self._staticLayer = None
+        pyG5Widget.resizeEvent(self, event)
 
-        brush = QBrush(QColor(0, 0, 0, 255))
-        self.qp.setBrush(brush)
+    def changeEvent(self, event):
+        """Invalidate the static layer when the widget font changes."""
+        if event.type() == QEvent.Type.FontChange:
+            self._staticLayer = None
+        pyG5Widget.changeEvent(self, event)
 
-        self.qp.drawPolygon(speedBox)
+    def buildStaticLayer(self):
+        """Render the fixed symbols drawn over the attitude.
 
-        font = self.qp.font()
-        font.setPixelSize(speedBoxHeight - 10)
-        # set default font size
-        self.qp.setFont(font)
+        The layer is transparent and drawn right after the rotating part,
+        the elements overlapping it are drawn on top in paintEvent.
 
-        self.qp.drawText(
-            QRectF(
-                speedBoxLeftAlign,
-                G5_CENTER_Y - speedBoxHeight / 2,
-                speedBoxWdith,
-                speedBoxHeight,
-            ),
-            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-            "{:03d}".format(int(self._kias)),
-        )
+        Returns:
+            QImage
+        """
+        layer = self.newLayer()
+        layer.fill(Qt.GlobalColor.transparent)
 
-        # draw the TAS box
-        rect = QRectF(
-            0,
-            0,
-            speedBoxLeftAlign + speedBoxWdith + 15,
-            tasHeight,
-        )
-        self.qp.drawRect(rect)
+        self.qp = QPainter(layer)
 
-        font = self.qp.font()
-        font.setPixelSize(20)
-        # set default font size
-        self.qp.setFont(font)
+        # create the fixed diamond
+        self.qp.setPen(self._penWhite1)
+        self.qp.setBrush(self._brushWhite)
 
-        self.qp.drawText(
-            rect,
-            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-            "TAS {:03d} kt".format(int(self._ktas)),
-        )
+        self.qp.drawPolygon(self._fixedDiamond)
 
-        # draw the TAS box
-        rect = QRectF(
-            0,
-            G5_HEIGHT - tasHeight,
-            speedBoxLeftAlign + speedBoxWdith + 15,
-            tasHeight,
-        )
-        self.qp.drawRect(rect)
-        self.qp.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "GS")
+        # create the nose
+        self.qp.setBrush(self._brushYellow)
 
-        self.setPen(2, Qt.GlobalColor.magenta)
+        self.qp.setPen(self._penBlack1)
 
-        self.qp.drawText(
-            rect,
-            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-            "{:03d} kt".format(int(self._gs * mstokt)),
-        )
+        # solid polygon left
+        self.qp.drawPolygon(self._noseLeft)
 
-        self.setPen(1, Qt.GlobalColor.magenta)
+        # solid polygon right
+        self.qp.drawPolygon(self._noseRight)
 
-        brush = QBrush(Qt.GlobalColor.magenta)
-        self.qp.setBrush(brush)
+        # solid marker left
+        self.qp.drawPolygon(self._markerLeft)
 
-        self.qp.drawRect(
-            QRectF(
-                speedBoxLeftAlign + speedBoxWdith + 15,
-                G5_CENTER_Y,
-                speedDeltaWidth,
-                -2 * (self._kiasDelta * 10) / tapeScale * G5_CENTER_Y,
-            )
-        )
+        # solid marker right
+        self.qp.drawPolygon(self._markerRight)
 
-        #################################################
-        # ALTITUDE TAPE
-        #################################################
+        self.qp.setBrush(self._brushCross)
+
+        # cross pattern polygon left
+        self.qp.drawPolygon(self._crossLeft)
 
+        # cross pattern polygon right
+        self.qp.drawPolygon(self._crossRight)
+
+        self.qp.setPen(self._penTransparent)
+        # solid polygon left
+        self.qp.drawPolygon(self._solidLeft)
+        # solid polygon right
+        self.qp.drawPolygon(self._solidRight)
+
+        # speed tape background
+        speedBoxLeftAlign = 7
+        speedBoxWdith = 75
+
+        self.qp.setBrush(self._brushShade)
+        self.qp.drawRect(QRectF(0, 0, speedBoxLeftAlign + speedBoxWdith + 15, G5_HEIGHT))
+
+        # altitude tape background
         altBoxRightAlign = 7
-        altBoxHeight = 30
         altBoxWdith = 75
         altBoxSpikedimension = 10
-        altTapeScale = 300
         altTapeLeftAlign = G5_WIDTH - altBoxRightAlign - altBoxWdith
-        altSettingHeight = 30
-
-        vsScale = 30
-        vsIndicatorWidth = 7
 
         alttapteLeftBound = altTapeLeftAlign - 1.5 * altBoxSpikedimension
-        self.setPen(0, Qt.GlobalColor.transparent)
-        self.qp.setBrush(QBrush(QColor(0, 0, 0, 90)))
         self.qp.drawRect(
             QRectF(alttapteLeftBound, 0, G5_WIDTH - alttapteLeftBound, int(G5_HEIGHT))
         )
-        self.setPen(2, Qt.GlobalColor.white)
-
-        self.qp.setBackgroundMode(Qt.BGMode.TransparentMode)
-        font = self.qp.font()
-        font.setPixelSize(10)
-        # set default font size
-        self.qp.setFont(font)
 
         # VS tape
+        vsScale = 30
+        vsIndicatorWidth = 7
+
+        self.qp.setPen(self._penWhite2)
+        self.qp.setFont(self.pixelFont(10, True))
+
         currentTape = vsScale
 
+        tickLines = []
         while currentTape >= 0:
             tapeHeight = (vsScale - currentTape) / vsScale * G5_HEIGHT
             if (currentTape % 5) == 0:
 
-                self.qp.drawLine(
-                    QPointF(G5_WIDTH - 10, tapeHeight),
-                    QPointF(G5_WIDTH, tapeHeight),
+                tickLines.append(
+                    QLineF(G5_WIDTH - 10, tapeHeight, G5_WIDTH, tapeHeight)
                 )
                 self.qp.drawText(
                     QRectF(
@@ -1331,211 +1792,434 @@ class pyG5AIWidget(pyG5Widget):
                         vsIndicatorWidth + 3,
                     ),
                     Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                    "{:d}".format(abs(int(currentTape - vsScale / 2))),
+                    f"{abs(int(currentTape - vsScale / 2)):d}",
                 )
             else:
-                self.qp.drawLine(
-                    QPointF(G5_WIDTH - vsIndicatorWidth, tapeHeight),
-                    QPointF(G5_WIDTH, tapeHeight),
+                tickLines.append(
+                    QLineF(
+                        G5_WIDTH - vsIndicatorWidth, tapeHeight, G5_WIDTH, tapeHeight
+                    )
                 )
 
             currentTape -= 1
-        # tapeHeight = (vsScale - currentTape) / vsScale * g5Height
-        vsHeight = -self._vh_ind_fpm / 100 / vsScale * G5_HEIGHT
-        vsRect = QRectF(G5_WIDTH, G5_CENTER_Y, -vsIndicatorWidth, vsHeight)
 
-        self.setPen(0, Qt.GlobalColor.transparent)
+        self.qp.drawLines(tickLines)
 
-        brush = QBrush(QColor(Qt.GlobalColor.magenta))
-        self.qp.setBrush(brush)
+        # turn rate scale
+        turnrateHalfWidth = 62
+        turnrateHeight = 15
 
-        self.qp.drawRect(vsRect)
+        self.qp.setPen(self._penTurnScale)
 
-        self.setPen(2, Qt.GlobalColor.white)
+        self.qp.drawLine(
+            QPointF(G5_CENTER_X, G5_HEIGHT - turnrateHeight),
+            QPointF(G5_CENTER_X, G5_HEIGHT),
+        )
+        self.qp.drawLine(
+            QPointF(G5_CENTER_X - turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
+            QPointF(G5_CENTER_X + turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
+        )
+
+        # slip ball marks
+        slipballHeigh = 320
+        slipballRadius = 15
+        slipballMarkeWidth = 6
+
+        self.qp.setPen(self._penSlipMarker)
+        self.qp.setBrush(self._brushSlipMarker)
+
+        self.qp.drawRect(
+            QRectF(
+                G5_CENTER_X - slipballRadius,
+                slipballHeigh - slipballRadius,
+                -slipballMarkeWidth,
+                2 * slipballRadius,
+            )
+        )
+        self.qp.drawRect(
+            QRectF(
+                G5_CENTER_X + slipballRadius,
+                slipballHeigh - slipballRadius,
+                slipballMarkeWidth,
+                2 * slipballRadius,
+            )
+        )
+
+        self.qp.end()
+
+        return layer
+
+    def paintEvent(self, event):
+        """Paint the widget."""
+        self.derive_settings()
+
+        if self._avionicson == 0:
+            self.paintAvionicsOff()
+            return
+
+        if self._staticLayer is None:
+            self._staticLayer = self.buildStaticLayer()
+
+        # the Antialiasing render hint is deliberately left off, the tapes,
+        # boxes and ticks are axis aligned and use the aliased raster path
+        self.qp = QPainter(self)
+
+        # labels outside of the repainted area are not laid out
+        paintRect = QRectF(event.rect())
 
-        font = self.qp.font()
-        font.setPixelSize(20)
         # set default font size
-        self.qp.setFont(font)
+        self.qp.setFont(self.pixelFont(6, True))
 
-        # altitude tape
-        currentTape = int(self._altitude + altTapeScale / 2)
+        self.qp.setPen(self._penWhite1)
+        self.qp.setBrush(self._skyBrush)
 
-        while currentTape > self._altitude - altTapeScale / 2:
-            if (currentTape % 20) == 0:
+        # draw contour + backgorun sky, both opaque and covering the widget
+        self.qp.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        self.qp.drawRect(QRectF(0, 0, G5_WIDTH, G5_HEIGHT))
+        self.qp.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
 
-                tapeHeight = (
-                                     1 - 2 * (currentTape - self._altitude) / altTapeScale
-                             ) * G5_CENTER_Y
-                self.qp.drawLine(
-                    QPointF(altTapeLeftAlign - 1.5 * altBoxSpikedimension, tapeHeight),
-                    QPointF(altTapeLeftAlign - altBoxSpikedimension / 2, tapeHeight),
-                )
-                if (currentTape % 100) == 0:
-                    self.qp.drawText(
-                        QRectF(
-                            altTapeLeftAlign,
-                            tapeHeight - speedBoxHeight / 2,
-                            speedBoxWdith,
-                            speedBoxHeight,
-                        ),
-                        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                        "{:d}".format(int(currentTape)),
-                    )
+        # draw the rotating part depending on the roll angle
+        self.qp.save()
+        self.qp.translate(G5_CENTER_X, G5_CENTER_Y)
+        if self._rollAngle:
+            self.qp.rotate(-self._rollAngle)
 
-            currentTape -= 1
+        pitchOffset = self._pitchAngle * self._pitchPixelPerDegree
 
-        altBox = QPolygonF(
-            [
-                QPointF(G5_WIDTH - altBoxRightAlign, G5_CENTER_Y - altBoxHeight / 2),
-                QPointF(
-                    altTapeLeftAlign,
-                    G5_CENTER_Y - altBoxHeight / 2,
-                ),
-                QPointF(
-                    altTapeLeftAlign,
-                    G5_CENTER_Y - altBoxSpikedimension,
-                ),
-                QPointF(
-                    altTapeLeftAlign - altBoxSpikedimension,
-                    G5_CENTER_Y,
-                ),
-                QPointF(
-                    altTapeLeftAlign,
-                    G5_CENTER_Y + altBoxSpikedimension,
-                ),
-                QPointF(
-                    altTapeLeftAlign,
-                    G5_CENTER_Y + altBoxHeight / 2,
-                ),
-                QPointF(G5_WIDTH - altBoxRightAlign, G5_CENTER_Y + altBoxHeight / 2),
-            ]
+        # draw the ground, only its top and the gradient start follow the
+        # pitch, they are rebuilt when it moved
+        if pitchOffset != self._groundBrushOffset:
+            self._groundRect = QRectF(
+                -g5Diag, pitchOffset, 2 * g5Diag, g5Diag - pitchOffset
+            )
+            self._groundGrad.setStart(G5_CENTER_X, pitchOffset)
+            self._groundBrush = QBrush(self._groundGrad)
+            self._groundBrushOffset = pitchOffset
+        self.qp.setBrush(self._groundBrush)
+
+        self.qp.drawRect(self._groundRect)
+
+        # draw the pitch lines up to the first one past the roll arc, on
+        # each side of the horizon
+        qp = self.qp
+        pitchLines = []
+        for (distances, lines, labels), limit in [
+            (self._pitchLadderUp, self.rollArcRadius - 40 - pitchOffset),
+            (self._pitchLadderDown, self.rollArcRadius - 30 + pitchOffset),
+        ]:
+            count = bisect_left(distances, limit) + 1
+            for index, base, label in labels:
+                if index >= count:
+                    break
+                height = base + pitchOffset
+                qp.drawText(QPoint(30 + 3, int(height + 2)), label)
+                qp.drawText(QPoint(-40, int(height + 2)), label)
+            pitchLines += lines[:count]
+
+        # the lines are stored at zero pitch, only the translation changes so
+        # it is undone rather than saving the whole painter state
+        qp.translate(0, pitchOffset)
+        qp.drawLines(pitchLines)
+        qp.translate(0, -pitchOffset)
+
+        # draw the static roll arc
+        self.qp.setPen(self._penWhite3)
+
+        bondingRect = QRectF(
+            -self.rollArcRadius,
+            -self.rollArcRadius,
+            2 * self.rollArcRadius,
+            2 * self.rollArcRadius,
         )
+        self.qp.drawArc(bondingRect, 30 * 16, 120 * 16)
 
-        brush = QBrush(QColor(0, 0, 0, 255))
-        self.qp.setBrush(brush)
+        # draw the Roll angle arc markers
+        self.qp.setBrush(self._brushWhite)
+        self.qp.setPen(self._penWhite2)
+        self.qp.drawLines(self._rollMarkerLines)
 
-        self.qp.drawPolygon(altBox)
+        self.qp.setPen(self._penWhite1)
+        # draw the diamond on top of the roll arc
+        self.qp.drawPolygon(self._rollDiamond)
 
-        self.qp.drawText(
-            QRectF(
-                altTapeLeftAlign,
-                G5_CENTER_Y - altBoxHeight / 2,
-                altBoxWdith,
-                altBoxHeight,
-            ),
-            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-            "{:05d}".format(int(self._altitude)),
-        )
+        self.qp.restore()
 
-        pen = self.qp.pen()
-        pen.setColor(Qt.GlobalColor.cyan)
-        pen.setWidth(2)
-        self.qp.setPen(pen)
-        leftAlign = altTapeLeftAlign - 1.5 * altBoxSpikedimension
-        rect = QRectF(
-            leftAlign,
-            G5_HEIGHT - altSettingHeight,
-            G5_WIDTH - leftAlign,
-            altSettingHeight,
-        )
-        self.qp.drawRect(rect)
-        self.qp.drawText(
-            rect,
-            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-            "{:02.02f}".format(self._alt_setting),
-        )
+        # aircraft symbol, side panels background, VS scale and turn marks
+        self.qp.drawImage(0, 0, self._staticLayer)
 
-        #################################################
-        # Turn coordinator
-        #################################################
+        # the side panels are only drawn when they are in the repainted area
+        region = event.region()
+
+        speedTape = region.intersects(self._speedTapeRect)
+        altitudeTape = region.intersects(self._altitudeTapeRect)
+        turnCoordinator = region.intersects(self._turnCoordinatorRect)
+
+        speedBoxLeftAlign = 7
+        speedBoxHeight = 50
+        speedBoxWdith = 75
+        tasHeight = 30
+        speedDeltaWidth = 4
+
+        tapeScale = 50
+        pixelPerKnot = 2 * G5_CENTER_Y / tapeScale
+        markerLeft = speedBoxLeftAlign + speedBoxWdith
+
+        altBoxRightAlign = 7
+        altBoxHeight = 30
+        altBoxWdith = 75
+        altBoxSpikedimension = 10
+        altTapeScale = 300
+        altTapeLeftAlign = G5_WIDTH - altBoxRightAlign - altBoxWdith
+        altSettingHeight = 30
+
+        vsScale = 30
+        vsIndicatorWidth = 7
+        vsPixelPerFpm = G5_HEIGHT / (100 * vsScale)
 
         turnrateHalfWidth = 62
         turnrateHeight = 15
+        turnrateMax = 73
         slipballHeigh = 320
         slipballRadius = 15
-        slipballMarkeWidth = 6
         slipballMovementMax = 1
         slipballMovementWdith = 15
 
-        self.setPen(1, QColor(0, 0, 0, 127))
+        #################################################
+        # Side panels bars
+        #################################################
 
-        self.qp.drawLine(
-            QPointF(G5_CENTER_X, G5_HEIGHT - turnrateHeight),
-            QPointF(G5_CENTER_X, G5_HEIGHT),
-        )
-        self.qp.drawLine(
-            QPointF(G5_CENTER_X - turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
-            QPointF(G5_CENTER_X + turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
-        )
+        # the speed bands, VS bar and turn rate bar do not overlap each other
+        # nor anything drawn before the outlines below, fill them all with the
+        # transparent pen before switching to the outline pens
+        self.qp.setPen(self._penTransparent)
+
+        if speedTape:
+            red, yellow, green, white = speedBands(
+                self._kias,
+                self._vs0,
+                self._vs,
+                self._vfe,
+                self._vno,
+                self._vne,
+                tapeScale,
+            )
+            for band, brush, left, width in (
+                (red, self._brushRed, 8, 8),
+                (yellow, self._brushYellow, 8, 8),
+                (green, self._brushGreen, 8, 8),
+                (white, self._brushWhite, 13, 3),
+            ):
+                if band is not None:
+                    self.qp.setBrush(brush)
+                    self.qp.drawRect(QRectF(markerLeft + left, band[0], width, band[1]))
+
+        self.qp.setBrush(self._brushMagenta)
+
+        if altitudeTape:
+            vsHeight = -self._vh_ind_fpm * vsPixelPerFpm
+            self.qp.drawRect(QRectF(G5_WIDTH, G5_CENTER_Y, -vsIndicatorWidth, vsHeight))
+
+        if turnCoordinator:
+            turnRate = self._turnRate
+            if turnRate > turnrateMax:
+                turnRate = turnrateMax
+            elif turnRate < -turnrateMax:
+                turnRate = -turnrateMax
 
-        self.setPen(0, Qt.GlobalColor.transparent)
+            self.qp.drawRect(
+                QRectF(
+                    G5_CENTER_X,
+                    G5_HEIGHT - turnrateHeight + 1,
+                    turnRate / 32 * turnrateHalfWidth,
+                    turnrateHeight - 2,
+                )
+            )
 
-        brush = QBrush(QColor(Qt.GlobalColor.magenta))
-        self.qp.setBrush(brush)
-        rect = QRectF(
-            G5_CENTER_X,
-            G5_HEIGHT - turnrateHeight + 1,
-            min(max(self._turnRate, -73), 73) / 32 * turnrateHalfWidth,
-            turnrateHeight - 2,
-        )
-        self.qp.drawRect(rect)
+        #################################################
+        # SPEED TAPE
+        #################################################
 
-        self.setPen(1, QColor(255, 255, 255, 128))
+        if speedTape:
+            kias = self._kias
 
-        self.qp.drawLine(
-            QPointF(G5_CENTER_X - turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
-            QPointF(G5_CENTER_X - turnrateHalfWidth, G5_HEIGHT),
-        )
-        self.qp.drawLine(
-            QPointF(G5_CENTER_X + turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
-            QPointF(G5_CENTER_X + turnrateHalfWidth, G5_HEIGHT),
-        )
+            self.qp.setPen(self._penWhite2)
 
-        # slip ball
-        # draw the static roll arc
-        self.setPen(2, QColor(0, 0, 0, 128))
+            self.qp.setFont(self.pixelFont(speedBoxHeight - 15, True))
 
-        self.qp.setBrush(QBrush(QColor(220, 220, 220)))
+            labelAlignment = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            # a single label rect is moved along the tape
+            labelRect = QRectF(speedBoxLeftAlign, 0, speedBoxWdith, speedBoxHeight)
+            tickPath = QPainterPath()
+            for currentTape, tapeHeight in tapeTicks(kias, tapeScale, 5, 0):
+                if (currentTape % 10) == 0:
+                    tickPath.moveTo(markerLeft + 5, tapeHeight)
+                    tickPath.lineTo(markerLeft + 15, tapeHeight)
 
-        self.qp.drawRect(
-            QRectF(
-                G5_CENTER_X - slipballRadius,
-                slipballHeigh - slipballRadius,
-                -slipballMarkeWidth,
-                2 * slipballRadius,
+                    labelRect.moveTop(tapeHeight - speedBoxHeight / 2)
+                    if labelRect.intersects(paintRect):
+                        self.drawStaticText(labelRect, labelAlignment, str(currentTape))
+
+                else:
+                    tickPath.moveTo(markerLeft + 8, tapeHeight)
+                    tickPath.lineTo(markerLeft + 15, tapeHeight)
+
+            self.qp.drawPath(tickPath)
+
+            self.qp.setBrush(self._brushBlack)
+
+            self.qp.drawPolygon(self._speedBox)
+
+            self.qp.setFont(self.pixelFont(speedBoxHeight - 10, True))
+
+            self.qp.drawText(
+                QRectF(
+                    speedBoxLeftAlign,
+                    G5_CENTER_Y - speedBoxHeight / 2,
+                    speedBoxWdith,
+                    speedBoxHeight,
+                ),
+                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
+                formatSpeed(kias),
             )
-        )
-        self.qp.drawRect(
-            QRectF(
-                G5_CENTER_X + slipballRadius,
-                slipballHeigh - slipballRadius,
-                slipballMarkeWidth,
-                2 * slipballRadius,
+
+            # draw the TAS box
+            rect = QRectF(
+                0,
+                0,
+                speedBoxLeftAlign + speedBoxWdith + 15,
+                tasHeight,
             )
-        )
-        # set slip ball gradian
-        grad = QRadialGradient(
-            G5_CENTER_X - self._slip * slipballMovementMax * slipballMovementWdith,
-            slipballHeigh,
-            slipballRadius,
-            G5_CENTER_X - self._slip * slipballMovementMax * slipballMovementWdith,
-            slipballHeigh,
-        )
-        grad.setColorAt(0, QColor(255, 255, 255, 200))
-        grad.setColorAt(1, QColor(160, 160, 160, 200))
-        self.qp.setBrush(grad)
-
-        self.qp.drawEllipse(
-            QPoint(
-                int(
-                    G5_CENTER_X - self._slip * slipballMovementMax * slipballMovementWdith
+            self.qp.drawRect(rect)
+
+            self.qp.setFont(self.pixelFont(20, True))
+
+            self.qp.drawText(
+                rect,
+                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
+                f"TAS {formatSpeed(self._ktas)} kt",
+            )
+
+            # draw the TAS box
+            rect = QRectF(
+                0,
+                G5_HEIGHT - tasHeight,
+                speedBoxLeftAlign + speedBoxWdith + 15,
+                tasHeight,
+            )
+            self.qp.drawRect(rect)
+            self.qp.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "GS")
+
+            # the text only uses the pen color, the ground speed and the speed
+            # trend share the same pen
+            self.qp.setPen(self._penMagenta1)
+
+            self.qp.drawText(
+                rect,
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                f"{formatSpeed(self._gs * mstokt)} kt",
+            )
+
+            self.qp.setBrush(self._brushMagenta)
+
+            self.qp.drawRect(
+                QRectF(
+                    markerLeft + 15,
+                    G5_CENTER_Y,
+                    speedDeltaWidth,
+                    -self._kiasDelta * 10 * pixelPerKnot,
+                )
+            )
+
+        #################################################
+        # ALTITUDE TAPE
+        #################################################
+
+        if altitudeTape:
+            self.qp.setPen(self._penWhite2)
+
+            self.qp.setFont(self.pixelFont(20, True))
+
+            # altitude tape
+            tickLeft = altTapeLeftAlign - 1.5 * altBoxSpikedimension
+            tickRight = altTapeLeftAlign - altBoxSpikedimension / 2
+            labelOffset = speedBoxHeight / 2
+            labelAlignment = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            labelRect = QRectF(altTapeLeftAlign, 0, speedBoxWdith, speedBoxHeight)
+
+            tickPath = QPainterPath()
+            for currentTape, tapeHeight in tapeTicks(self._altitude, altTapeScale, 20):
+                tickPath.moveTo(tickLeft, tapeHeight)
+                tickPath.lineTo(tickRight, tapeHeight)
+                if (currentTape % 100) == 0:
+                    labelRect.moveTop(tapeHeight - labelOffset)
+                    if labelRect.intersects(paintRect):
+                        self.drawStaticText(labelRect, labelAlignment, str(currentTape))
+
+            self.qp.drawPath(tickPath)
+
+            self.qp.setBrush(self._brushBlack)
+
+            self.qp.drawPolygon(self._altBox)
+
+            self.qp.drawText(
+                QRectF(
+                    altTapeLeftAlign,
+                    G5_CENTER_Y - altBoxHeight / 2,
+                    altBoxWdith,
+                    altBoxHeight,
                 ),
-                int(slipballHeigh),
-            ),
-            slipballRadius,
-            slipballRadius,
-        )
+                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
+                formatAltitude(self._altitude),
+            )
+
+            self.qp.setPen(self._penCyan2)
+            rect = QRectF(
+                tickLeft,
+                G5_HEIGHT - altSettingHeight,
+                G5_WIDTH - tickLeft,
+                altSettingHeight,
+            )
+            self.qp.drawRect(rect)
+            self.qp.drawText(
+                rect,
+                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
+                f"{self._alt_setting:02.02f}",
+            )
+
+        #################################################
+        # Turn coordinator
+        #################################################
+
+        if turnCoordinator:
+            self.qp.setPen(self._penTurnMarker)
+
+            self.qp.drawLine(
+                QPointF(G5_CENTER_X - turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
+                QPointF(G5_CENTER_X - turnrateHalfWidth, G5_HEIGHT),
+            )
+            self.qp.drawLine(
+                QPointF(G5_CENTER_X + turnrateHalfWidth, G5_HEIGHT - turnrateHeight),
+                QPointF(G5_CENTER_X + turnrateHalfWidth, G5_HEIGHT),
+            )
+
+            # slip ball
+            self.qp.setPen(self._penSlipMarker)
+
+            # move the slip ball gradient with the ball
+            slipballX = (
+                G5_CENTER_X - self._slip * slipballMovementMax * slipballMovementWdith
+            )
+            self._slipBallBrush.setTransform(
+                QTransform.fromTranslate(slipballX, slipballHeigh)
+            )
+            self.qp.setBrush(self._slipBallBrush)
+
+            self.qp.drawEllipse(
+                QPoint(int(slipballX), int(slipballHeigh)),
+                slipballRadius,
+                slipballRadius,
+            )
+
         self.draw_glideslope(12, 172, 100, Qt.GlobalColor.white, G5_CENTER_Y)
 
         self.qp.end()
@@ -1565,13 +2249,23 @@ class pyG5AIWidget(pyG5Widget):
         Returns:
             Qline
         """
+        trig = TRIG_5DEG.get(abs(angle))
+        if trig is None:
+            cosAngle = cos(radians(angle))
+            sinAngle = sin(radians(angle))
+        else:
+            # cos is even and sin is odd, the table covers negative angles too
+            cosAngle, sinAngle = trig
+            if angle < 0:
+                sinAngle = -sinAngle
+
         startPoint = QPoint(
-            int(self.rollArcRadius * cos(radians(angle))),
-            int(self.rollArcRadius * sin(radians(angle))),
+            int(self.rollArcRadius * cosAngle),
+            int(self.rollArcRadius * sinAngle),
         )
         endPoint = QPoint(
-            int((self.rollArcRadius + length) * cos(radians(angle))),
-            int((self.rollArcRadius + length) * sin(radians(angle))),
+            int((self.rollArcRadius + length) * cosAngle),
+            int((self.rollArcRadius + length) * sinAngle),
         )
 
         return QLine(startPoint, endPoint)
@@ -6,6 +6,8 @@ Created on 8 Aug 2021.
 
 import sys
 
+from functools import partial
+
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import (
     QApplication,
@@ -144,12 +146,16 @@ if __name__ == "__main__":
 
     for control in controls:
         widget, slider = controlWidgetGen(control)
-        try:
-            slider.valueChanged.connect(getattr(g5View.pyG5AI, control["name"]))
-            slider.valueChanged.connect(getattr(g5View.pyG5HSI, control["name"]))
+        if hasattr(g5View.pyG5AI, "_{}".format(control["name"])):
+            slider.valueChanged.connect(
+                partial(g5View.pyG5AI.setValue, control["name"])
+            )
+            slider.valueChanged.connect(
+                partial(g5View.pyG5HSI.setValue, control["name"])
+            )
             print("Slider connected: {}".format(control["name"]))
-        except Exception as inst:
-            print("{} control not connected to view: {}".format(control["name"], inst))
+        else:
+            print("{} control not connected to view".format(control["name"]))
 
         controlVLayout.addWidget(widget)
     controlVLayout.addStretch()
@@ -0,0 +1 @@
+"""Tests for the pyG5 package."""
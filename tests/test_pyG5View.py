@@ -0,0 +1,120 @@
+"""Tests of the pyG5 view."""
+
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtCore import QRectF, Qt  # noqa: E402
+from qtpy.QtGui import QImage, QPainter  # noqa: E402
+from qtpy.QtWidgets import QApplication  # noqa: E402
+
+from pyG5.pyG5View import (  # noqa: E402
+    STATIC_TEXT_CACHE_SIZE,
+    pyG5AIWidget,
+    pyG5HSIWidget,
+)
+
+app = None
+
+
+def setUpModule():
+    """Create the application the widgets need."""
+    global app
+    app = QApplication.instance() or QApplication(sys.argv)
+
+
+class GpsCdiAnnunciatorTest(unittest.TestCase):
+    """Check the GPS CDI annunciator derived from the HSI sensitivity."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the HSI widget."""
+        cls.widget = pyG5HSIWidget()
+        cls.widget._hsiSource = 2
+
+    def annunciator(self, sensitivity):
+        """Return the annunciator for a GPS HSI sensitivity."""
+        self.widget._gpshsisens = sensitivity
+        self.widget.derive_settings()
+        return self.widget.gps_cdi_annunciator
+
+    def test_lnav(self):
+        """Sensitivities at or below 0.1 are LNAV."""
+        for sensitivity in (0, 0.05, 0.1, 0.104):
+            self.assertEqual(self.annunciator(sensitivity), "LNAV")
+
+    def test_departure(self):
+        """A 0.12 sensitivity is DEPT."""
+        for sensitivity in (0.12, 0.1201, 0.1199):
+            self.assertEqual(self.annunciator(sensitivity), "DEPT")
+
+    def test_terminal(self):
+        """A 0.4 sensitivity is TERM."""
+        for sensitivity in (0.4, 0.4001, 0.3999):
+            self.assertEqual(self.annunciator(sensitivity), "TERM")
+
+    def test_enroute(self):
+        """A 0.8 sensitivity is ENR."""
+        for sensitivity in (0.8, 0.8001, 0.7999):
+            self.assertEqual(self.annunciator(sensitivity), "ENR")
+
+    def test_unknown(self):
+        """Other sensitivities have no annunciator."""
+        for sensitivity in (0.2, 0.6, 1.0):
+            self.assertEqual(self.annunciator(sensitivity), "")
+
+
+class StaticTextCacheTest(unittest.TestCase):
+    """Check the bound of the laid out texts cache."""
+
+    def test_eviction(self):
+        """The least recently drawn texts are dropped past the cache size."""
+        widget = pyG5HSIWidget()
+        image = QImage(10, 10, QImage.Format.Format_ARGB32_Premultiplied)
+        widget.qp = QPainter(image)
+        rect = QRectF(0, 0, 10, 10)
+
+        widget.drawStaticText(rect, Qt.AlignmentFlag.AlignLeft, "first")
+        widget.drawStaticText(rect, Qt.AlignmentFlag.AlignLeft, "second")
+        for i in range(STATIC_TEXT_CACHE_SIZE - 1):
+            widget.drawStaticText(rect, Qt.AlignmentFlag.AlignLeft, str(i))
+            # keep the first text recently drawn
+            widget.drawStaticText(rect, Qt.AlignmentFlag.AlignLeft, "first")
+        widget.qp.end()
+
+        texts = [text for fontKey, text in widget._staticTexts]
+        self.assertEqual(len(texts), STATIC_TEXT_CACHE_SIZE)
+        self.assertIn("first", texts)
+        self.assertNotIn("second", texts)
+
+
+class DisplayedPropertiesTest(unittest.TestCase):
+    """Check which DREF changes schedule a repaint."""
+
+    def updates(self, widget, attribute, value):
+        """Return the update calls made when a DREF changes a property."""
+        calls = []
+        widget.update = lambda *args: calls.append(args)
+        widget.drefHandler({0: (value, None, None, attribute)})
+        return calls
+
+    def test_hsi(self):
+        """The HSI only repaints the properties it draws."""
+        widget = pyG5HSIWidget()
+        self.assertEqual(self.updates(widget, "_kias", 100), [])
+        self.assertEqual(widget._kias, 100)
+        self.assertEqual(self.updates(widget, "_magHeading", 90), [()])
+
+    def test_ai(self):
+        """The attitude indicator only repaints the properties it draws."""
+        widget = pyG5AIWidget()
+        self.assertEqual(self.updates(widget, "_magHeading", 90), [])
+        self.assertEqual(widget._magHeading, 90)
+        self.assertEqual(self.updates(widget, "_pitchAngle", 5), [()])
+        self.assertEqual(len(self.updates(widget, "_kias", 100)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()